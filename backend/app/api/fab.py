@@ -8,7 +8,7 @@ Virtual Fab API Endpoints
 from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -49,8 +49,7 @@ class EquipmentResponse(BaseModel):
     last_maintenance: Optional[datetime]
     next_maintenance: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WIPCreate(BaseModel):
@@ -79,8 +78,7 @@ class WIPResponse(BaseModel):
     current_queue: Optional[str]
     status: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ScenarioCreate(BaseModel):
@@ -107,8 +105,7 @@ class ScenarioResponse(BaseModel):
     executed_at: Optional[datetime]
     completed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SimulationRequest(BaseModel):
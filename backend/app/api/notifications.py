@@ -7,7 +7,7 @@ Notification API Endpoints
 from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -49,8 +49,7 @@ class AlertRuleResponse(BaseModel):
     last_triggered_at: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AlertRuleUpdate(BaseModel):
@@ -79,8 +78,7 @@ class AlertResponse(BaseModel):
     resolved_at: Optional[datetime]
     triggered_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RecipientCreate(BaseModel):
@@ -104,8 +102,7 @@ class RecipientResponse(BaseModel):
     escalation_level: int
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MetricsCheck(BaseModel):
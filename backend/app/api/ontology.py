@@ -5,6 +5,7 @@ Ontology API
 """
 
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import Response
 from typing import Optional
 
 from app.ontology import (
@@ -15,6 +16,8 @@ from app.ontology import (
     ProcessFlowOntology,
     FailureModeOntology,
 )
+# 테이블은 최초 접근 시 생성되므로 이름이 아닌 모듈로 import (import 시점 생성 방지)
+from app.ontology import equipment as _equipment, failure_modes as _failure_modes
 
 router = APIRouter(prefix="/ontology", tags=["Domain Ontology"])
 
@@ -197,7 +200,7 @@ def list_materials(
         except ValueError:
             raise HTTPException(400, f"Unknown category: {category}")
     else:
-        mats = list(MaterialsKnowledgeBase.get_all_materials().values())
+        mats = MaterialsKnowledgeBase.get_all_values()
 
     return {
         "count": len(mats),
@@ -254,7 +257,7 @@ def list_equipment(category: Optional[str] = None):
              "mtbf_hours": e.mtbf_hours}
             for e in equips]}
 
-    equips = EquipmentKnowledgeBase.get_all_equipment()
+    equips = _equipment.EQUIPMENT_DB
     return {k: {"name": v.name, "vendor": v.vendor.name,
                 "category": v.category.value,
                 "throughput_wph": v.throughput_wph,
@@ -265,10 +268,10 @@ def list_equipment(category: Optional[str] = None):
 @router.get("/equipment/{model_key}")
 def get_equipment(model_key: str):
     """장비 상세 사양"""
-    equip = EquipmentKnowledgeBase.get_equipment(model_key)
-    if not equip:
+    body = EquipmentKnowledgeBase.get_equipment_json(model_key)
+    if body is None:
         raise HTTPException(404, f"Equipment not found: {model_key}")
-    return equip
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/equipment/vendor-share/{category}")
@@ -279,7 +282,10 @@ def get_vendor_market_share(category: str):
         cat = EquipCategory(category)
     except ValueError:
         raise HTTPException(400, f"Unknown category: {category}")
-    return EquipmentKnowledgeBase.get_vendor_market_share(cat)
+    return {
+        s.vendor: {"share_pct": s.share_pct, "products": s.products}
+        for s in EquipmentKnowledgeBase.get_vendor_market_share(cat)
+    }
 
 
 @router.get("/equipment/fab-cost-estimator")
@@ -313,7 +319,7 @@ def get_process_flow(module: Optional[str] = None):
             {"step_id": s.step_id, "name": s.name,
              "module": s.module.value, "order": s.order,
              "equipment_type": s.equipment_type,
-             "yield_impact": s.yield_impact,
+             "yield_impact": s.yield_impact.value,
              "description": s.description}
             for s in steps
         ]
@@ -333,9 +339,9 @@ def get_process_step(step_id: str):
 def get_node_complexity(node: str):
     """노드별 공정 복잡도"""
     complexity = ProcessFlowOntology.get_node_complexity(node)
-    if not complexity:
+    if complexity is None:
         raise HTTPException(404, f"Node not found: {node}")
-    return {"node": node, **complexity}
+    return {"node": node, **complexity._asdict()}
 
 
 # ============================================================
@@ -348,7 +354,7 @@ def list_defect_types(process_step: Optional[str] = None):
     if process_step:
         defects = FailureModeOntology.get_defects_for_process(process_step)
     else:
-        defects = list(FailureModeOntology.get_all_defect_types().values())
+        defects = list(_failure_modes.DEFECT_TYPES.values())
 
     return {
         "count": len(defects),
@@ -4,7 +4,9 @@ from typing import Optional
 
 from ..database import get_db
 from ..models import ProcessNode, IPBlock
-from ..schemas import ProcessNodeResponse, IPBlockResponse
+from ..schemas import (
+    ProcessNodeResponse, IPBlockResponse, ProcessNodeListAdapter, IPBlockListAdapter
+)
 
 router = APIRouter()
 
@@ -47,7 +49,7 @@ async def get_process_nodes(
             ),
         ]
 
-    return [ProcessNodeResponse.model_validate(node) for node in nodes]
+    return ProcessNodeListAdapter.validate_python(nodes, from_attributes=True)
 
 
 @router.get("/process-nodes/{node_id}", response_model=ProcessNodeResponse)
@@ -124,7 +126,7 @@ async def get_ip_library(
             ),
         ]
 
-    return [IPBlockResponse.model_validate(block) for block in blocks]
+    return IPBlockListAdapter.validate_python(blocks, from_attributes=True)
 
 
 @router.get("/ip-library/{ip_id}", response_model=IPBlockResponse)
@@ -0,0 +1,16 @@
+"""
+공통 응답 헬퍼
+"""
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    pydantic-core로 바로 직렬화해 반환
+
+    응답 모델 재검증/jsonable_encoder/json.dumps 단계를 생략하고
+    Rust 직렬화기로 한 번에 JSON을 생성합니다. (dict 필드가 많은 응답에 유리)
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
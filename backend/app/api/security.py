@@ -7,10 +7,11 @@ Security API Endpoints
 from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.services.access_control import AccessControlEngine
 from app.services.audit_logger import AuditLogger
 from app.services.data_masking import DataMaskingService
@@ -38,8 +39,7 @@ class UserResponse(BaseModel):
     created_at: datetime
     roles: list[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoleCreate(BaseModel):
@@ -57,8 +57,7 @@ class RoleResponse(BaseModel):
     level: int
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PolicyCreate(BaseModel):
@@ -85,8 +84,7 @@ class PolicyResponse(BaseModel):
     valid_from: Optional[datetime]
     valid_until: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AccessCheckRequest(BaseModel):
@@ -114,8 +112,7 @@ class AuditLogResponse(BaseModel):
     ip_address: Optional[str]
     details: Optional[dict]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MaskingRuleCreate(BaseModel):
@@ -140,8 +137,7 @@ class MaskingRuleResponse(BaseModel):
     applies_to_roles: list[str]
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ==================== Users ====================
@@ -519,28 +515,39 @@ def get_failed_logins(
 def export_audit_logs(
     start_date: datetime,
     end_date: datetime,
-    format: str = Query(default="json", regex="^(json|csv)$"),
-    db: Session = Depends(get_db)
+    format: str = Query(default="json", regex="^(json|csv)$")
 ):
-    """감사 로그 내보내기"""
-    audit = AuditLogger(db)
-    content = audit.export_logs(start_date, end_date, format=format)
-
-    # 감사 로그 (내보내기 기록)
-    audit.log_export(
-        user_id=0,
-        user_role="system",
-        resource="audit_logs",
-        export_format=format,
-        record_count=len(content.split("\n")) if format == "csv" else content.count('"log_id"')
+    """감사 로그 내보내기 (파일 본문 스트리밍)"""
+
+    def content():
+        # 응답 스트리밍은 엔드포인트 반환 이후 진행되므로 요청 세션 대신 전용 세션 사용
+        db = SessionLocal()
+        try:
+            audit = AuditLogger(db)
+
+            # 감사 로그 (내보내기 기록) - 중간에 끊긴 스트림도 전송된 만큼 기록
+            def log_export(record_count: int, completed: bool):
+                audit.log_export(
+                    user_id=0,
+                    user_role="system",
+                    resource="audit_logs",
+                    export_format=format,
+                    record_count=record_count,
+                    details={"completed": completed}
+                )
+
+            yield from audit.export_logs(start_date, end_date, format=format, on_complete=log_export)
+        finally:
+            db.close()
+
+    media_type = "text/csv" if format == "csv" else "application/json"
+    filename = f"audit_logs_{start_date:%Y%m%d}_{end_date:%Y%m%d}.{format}"
+    return StreamingResponse(
+        content(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
-    return {
-        "format": format,
-        "period": {"start": start_date.isoformat(), "end": end_date.isoformat()},
-        "content": content
-    }
-
 
 @router.post("/audit/report")
 def generate_compliance_report(
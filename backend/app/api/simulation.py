@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 from uuid import UUID
 from datetime import datetime
+from functools import lru_cache
 import uuid
 
 from ..database import get_db
@@ -21,6 +22,7 @@ from ..schemas.ppa import PPAAlternativeItem, AreaBreakdown, PowerBreakdown
 from ..schemas.cost import VolumeAnalysisRequest, VolumeEconomicsItem
 from ..services import PPAEngine, CostSimulator
 from ..services.ppa_engine import ChipConfig
+from .responses import json_response
 
 router = APIRouter()
 
@@ -58,6 +60,58 @@ def ppa_result_to_response(result) -> PPAResponse:
     )
 
 
+# 계산은 입력에 대해 결정적이므로 동일 구성 반복 요청은 캐시에서 응답
+# (ValueError는 캐시되지 않음). 캐시된 응답 모델은 변경 가능하므로
+# 호출자마다 깊은 복사본을 돌려준다.
+@lru_cache(maxsize=4096)
+def _cached_ppa(chip_config: ChipConfig) -> PPAResponse:
+    return ppa_result_to_response(ppa_engine.calculate(chip_config))
+
+
+@lru_cache(maxsize=4096)
+def _cached_ppa_alternatives(chip_config: ChipConfig) -> PPAAlternativesResponse:
+    alternatives = ppa_engine.generate_alternatives(chip_config)
+    items = [
+        PPAAlternativeItem(
+            variant=variant,
+            result=ppa_result_to_response(result)
+        )
+        for variant, result in alternatives
+    ]
+    return PPAAlternativesResponse(alternatives=items)
+
+
+def _calculate_ppa(chip_config: ChipConfig) -> PPAResponse:
+    return _cached_ppa(chip_config).model_copy(deep=True)
+
+
+def _calculate_ppa_alternatives(chip_config: ChipConfig) -> PPAAlternativesResponse:
+    return _cached_ppa_alternatives(chip_config).model_copy(deep=True)
+
+
+# 비용 계산 결과는 CostSimulator.calculate_cost 가 인스턴스별로 캐시하므로 여기서는 변환만
+def _calculate_cost(die_size: float, node_nm: int, volume: int, target_asp: float) -> CostResponse:
+    result = cost_simulator.calculate_cost(
+        die_size=die_size,
+        node_nm=node_nm,
+        volume=volume,
+        target_asp=target_asp,
+    )
+    return CostResponse(
+        wafer_cost=result.wafer_cost,
+        die_cost=result.die_cost,
+        good_die_cost=result.good_die_cost,
+        package_cost=result.package_cost,
+        test_cost=result.test_cost,
+        total_unit_cost=result.total_unit_cost,
+        target_asp=result.target_asp,
+        gross_margin=result.gross_margin,
+        gross_margin_percent=result.gross_margin_percent,
+        net_die_per_wafer=result.net_die_per_wafer,
+        yield_rate=result.yield_rate,
+    )
+
+
 @router.post("/ppa", response_model=PPAResponse)
 async def simulate_ppa(request: ChipConfigRequest):
     """
@@ -66,9 +120,7 @@ async def simulate_ppa(request: ChipConfigRequest):
     칩 구성을 기반으로 다이 면적, 전력 소비, 성능을 계산합니다.
     """
     try:
-        chip_config = config_request_to_chip_config(request)
-        result = ppa_engine.calculate(chip_config)
-        return ppa_result_to_response(result)
+        return _calculate_ppa(config_request_to_chip_config(request))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -81,18 +133,7 @@ async def simulate_ppa_alternatives(request: ChipConfigRequest):
     현재 구성과 함께 저전력/고성능 대안을 함께 제안합니다.
     """
     try:
-        chip_config = config_request_to_chip_config(request)
-        alternatives = ppa_engine.generate_alternatives(chip_config)
-
-        items = [
-            PPAAlternativeItem(
-                variant=variant,
-                result=ppa_result_to_response(result)
-            )
-            for variant, result in alternatives
-        ]
-
-        return PPAAlternativesResponse(alternatives=items)
+        return _calculate_ppa_alternatives(config_request_to_chip_config(request))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -105,24 +146,11 @@ async def simulate_cost(request: CostRequest):
     다이 크기와 공정 노드를 기반으로 제조 비용을 계산합니다.
     """
     try:
-        result = cost_simulator.calculate_cost(
-            die_size=request.die_size_mm2,
-            node_nm=request.process_node_nm,
-            volume=request.volume,
-            target_asp=request.target_asp,
-        )
-        return CostResponse(
-            wafer_cost=result.wafer_cost,
-            die_cost=result.die_cost,
-            good_die_cost=result.good_die_cost,
-            package_cost=result.package_cost,
-            test_cost=result.test_cost,
-            total_unit_cost=result.total_unit_cost,
-            target_asp=result.target_asp,
-            gross_margin=result.gross_margin,
-            gross_margin_percent=result.gross_margin_percent,
-            net_die_per_wafer=result.net_die_per_wafer,
-            yield_rate=result.yield_rate,
+        return _calculate_cost(
+            request.die_size_mm2,
+            request.process_node_nm,
+            request.volume,
+            request.target_asp,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -217,7 +245,7 @@ async def run_full_simulation(
         db.add(simulation)
         db.commit()
 
-        return FullSimulationResponse(
+        return json_response(FullSimulationResponse(
             id=simulation_id,
             name=request.name,
             config=request.config,
@@ -237,7 +265,7 @@ async def run_full_simulation(
             ),
             confidence_score=ppa_result.confidence_score,
             created_at=datetime.utcnow(),
-        )
+        ))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -295,7 +323,7 @@ async def get_simulation(
     ppa_data = simulation.result.get("ppa", {})
     cost_data = simulation.result.get("cost", {})
 
-    return FullSimulationResponse(
+    return json_response(FullSimulationResponse(
         id=simulation.id,
         name=simulation.name,
         config=ChipConfigRequest(**simulation.config),
@@ -312,4 +340,4 @@ async def get_simulation(
         cost=CostResponse(**cost_data),
         confidence_score=simulation.confidence_score or 0,
         created_at=simulation.created_at,
-    )
+    ))
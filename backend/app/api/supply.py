@@ -8,7 +8,7 @@ Tier-N 가시성, 리스크 관리, 재고 최적화
 from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -51,8 +51,7 @@ class SupplierResponse(BaseModel):
     contract_status: Optional[str]
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MaterialCreate(BaseModel):
@@ -86,8 +85,7 @@ class MaterialResponse(BaseModel):
     total_value: Optional[float]
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RiskCreate(BaseModel):
@@ -114,8 +112,7 @@ class RiskResponse(BaseModel):
     detected_at: datetime
     mitigation_actions: Optional[list]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OrderSimulationRequest(BaseModel):
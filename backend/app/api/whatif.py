@@ -7,6 +7,7 @@ What-If Simulation API
 from fastapi import APIRouter, HTTPException
 
 from ..neo4j_client import Neo4jClient
+from .responses import json_response
 from ..schemas.whatif_schema import (
     WhatIfRequest,
     WhatIfResponse,
@@ -106,11 +107,11 @@ async def execute_whatif(request: WhatIfRequest):
         except Exception:
             narrative = None
 
-    return WhatIfResponse(
+    return json_response(WhatIfResponse(
         scenario=scenario,
         affected_nodes=result["affected_nodes"],
         affected_node_ids=result["affected_node_ids"],
         total_affected=result["total_affected"],
         alternatives=result.get("alternatives", []),
         narrative=narrative,
-    )
+    ))
@@ -37,6 +37,7 @@ from ..services.workload_presets import (
     get_preset_profile,
     WORKLOAD_PRESETS,
 )
+from .responses import json_response
 
 router = APIRouter()
 
@@ -99,7 +100,7 @@ async def analyze_workload(request: WorkloadProfileRequest):
         result = workload_analyzer.analyze(profile)
 
         # 응답 변환
-        return WorkloadAnalysisResponse(
+        return json_response(WorkloadAnalysisResponse(
             workload_name=result.workload_profile.name,
             workload_type=request.workload_type,
             characterization=WorkloadCharacterizationResponse(
@@ -144,7 +145,7 @@ async def analyze_workload(request: WorkloadProfileRequest):
             ],
             confidence_score=result.confidence_score,
             analysis_notes=result.analysis_notes,
-        )
+        ))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -234,7 +235,7 @@ async def analyze_preset_workload(preset_id: str):
     try:
         result = workload_analyzer.analyze(profile)
 
-        return WorkloadAnalysisResponse(
+        return json_response(WorkloadAnalysisResponse(
             workload_name=result.workload_profile.name,
             workload_type=result.workload_profile.workload_type.value,
             characterization=WorkloadCharacterizationResponse(
@@ -279,7 +280,7 @@ async def analyze_preset_workload(preset_id: str):
             ],
             confidence_score=result.confidence_score,
             analysis_notes=result.analysis_notes,
-        )
+        ))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"분석 중 오류 발생: {str(e)}")
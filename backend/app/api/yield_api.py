@@ -13,6 +13,7 @@ from app.database import get_db
 from app.services.yield_analyzer import YieldAnalyzer
 from app.services.audit_logger import AuditLogger
 from app.services.data_masking import DataMaskingService
+from app.api.responses import json_response
 from app.schemas.yield_schema import (
     WaferRecordCreate, WaferRecordResponse,
     YieldEventCreate, YieldEventUpdate, YieldEventResponse,
@@ -288,7 +289,7 @@ def get_yield_dashboard(
     - product_id: 특정 제품 필터 (선택)
     """
     analyzer = YieldAnalyzer(db)
-    return analyzer.get_dashboard_data(days=days, product_id=product_id)
+    return json_response(analyzer.get_dashboard_data(days=days, product_id=product_id))
 
 
 @router.get("/trends", response_model=list[YieldTrendPoint])
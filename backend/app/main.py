@@ -43,7 +43,9 @@ async def lifespan(app: FastAPI):
     # Connect Neo4j (graceful — app works without it)
     Neo4jClient.connect()
     yield
-    # Shutdown
+    # Shutdown: 대기 중인 감사 로그 기록
+    from .services.audit_logger import flush_audit_logs
+    flush_audit_logs()
     Neo4jClient.close()
 
 
@@ -4,7 +4,7 @@ Security Models
 사용자, 역할, 권한, 감사 로그 모델
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -106,6 +106,7 @@ class AuditLog(Base):
     __tablename__ = "audit_logs"
 
     id = Column(Integer, primary_key=True, index=True)
+    log_id = Column(String(50), unique=True, index=True)
 
     # 사용자 정보
     user_id = Column(String(50), index=True)
@@ -131,6 +132,20 @@ class AuditLog(Base):
     # 타임스탬프
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
 
+    # 기간 + 그룹 키 집계용 (활동 요약)
+    __table_args__ = (
+        Index("ix_audit_logs_timestamp_action", "timestamp", "action"),
+        Index("ix_audit_logs_timestamp_user_id", "timestamp", "user_id"),
+    )
+
+
+# 보안 이벤트 severity 필터용 표현식 인덱스 (PostgreSQL 에서는 SECURITY_EVENT 행만 부분 인덱스)
+Index(
+    "ix_audit_logs_details_severity",
+    AuditLog.details["severity"].as_string(),
+    postgresql_where=AuditLog.action == "SECURITY_EVENT",
+)
+
 
 class DataMaskingRule(Base):
     """데이터 마스킹 규칙"""
@@ -4,6 +4,8 @@ Silicon Nexus Domain Ontology
 반도체 및 AI 산업 도메인 지식 체계
 """
 
+from importlib import import_module
+
 from .semiconductor import SemiconductorOntology
 from .ai_industry import AIIndustryOntology
 from .materials import MaterialsKnowledgeBase
@@ -11,6 +13,27 @@ from .equipment import EquipmentKnowledgeBase
 from .process_flow import ProcessFlowOntology
 from .failure_modes import FailureModeOntology
 
+# 테이블 상수는 하위 모듈과 마찬가지로 최초 접근 시 생성 (PEP 562)
+# - 패키지에서 이름으로 import 하면 import 시점에 생성되므로,
+#   모듈 내부 코드는 하위 모듈을 import 해 속성으로 접근할 것
+_LAZY_TABLES = {
+    "EQUIPMENT_DB": ".equipment",
+    "VENDOR_MARKET_SHARE": ".equipment",
+    "DEFECT_TYPES": ".failure_modes",
+    "EQUIPMENT_FAILURE_MODES": ".failure_modes",
+    "MATERIALS": ".materials",
+    "LOGIC_PROCESS_FLOW": ".process_flow",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_TABLES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module_name, __name__), name)
+    return value
+
+
 __all__ = [
     "SemiconductorOntology",
     "AIIndustryOntology",
@@ -18,4 +41,10 @@ __all__ = [
     "EquipmentKnowledgeBase",
     "ProcessFlowOntology",
     "FailureModeOntology",
+    "EQUIPMENT_DB",
+    "VENDOR_MARKET_SHARE",
+    "DEFECT_TYPES",
+    "EQUIPMENT_FAILURE_MODES",
+    "MATERIALS",
+    "LOGIC_PROCESS_FLOW",
 ]
@@ -9,10 +9,30 @@ Sources:
 - Industry benchmarks
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
+import json
+from array import array
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping, NamedTuple, Optional, Sequence
 from enum import Enum
 
+__all__ = [
+    "EquipCategory",
+    "VendorRegion",
+    "EquipmentVendorInfo",
+    "MaintenanceProfile",
+    "EquipmentSpec",
+    "VendorShare",
+    "EQUIPMENT_DB",
+    "VENDOR_MARKET_SHARE",
+    "FAB_BASE_CAPEX_MILLION_USD",
+    "EQUIP_NUMERIC_COLUMNS",
+    "equipment_table",
+    "EquipmentKnowledgeBase",
+]
+
 
 class EquipCategory(str, Enum):
     LITHOGRAPHY = "LITHOGRAPHY"
@@ -27,6 +47,19 @@ class EquipCategory(str, Enum):
     TEST = "TEST"
 
 
+# 조회/키 구성에 쓰는 카테고리 싱글톤 (Enum 메타클래스 속성 조회 생략)
+_CAT_LITHO = EquipCategory.LITHOGRAPHY
+_CAT_ETCH = EquipCategory.ETCH
+_CAT_DEP = EquipCategory.DEPOSITION
+_CAT_CMP = EquipCategory.CMP
+_CAT_IMPLANT = EquipCategory.ION_IMPLANT
+_CAT_CLEAN = EquipCategory.CLEAN
+_CAT_METROLOGY = EquipCategory.METROLOGY
+_CAT_INSPECTION = EquipCategory.INSPECTION
+_CAT_THERMAL = EquipCategory.THERMAL
+_CAT_TEST = EquipCategory.TEST
+
+
 class VendorRegion(str, Enum):
     NETHERLANDS = "Netherlands"
     JAPAN = "Japan"
@@ -34,7 +67,7 @@ class VendorRegion(str, Enum):
     SOUTH_KOREA = "South Korea"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EquipmentVendorInfo:
     """장비 제조사 정보"""
     name: str
@@ -43,18 +76,17 @@ class EquipmentVendorInfo:
     export_controlled: bool = False
 
 
-@dataclass
-class MaintenanceProfile:
-    """유지보수 프로파일"""
+class MaintenanceProfile(NamedTuple):
+    """유지보수 프로파일 (EquipmentSpec.maintenance 조회용 뷰)"""
     pm_interval_hours: int              # 예방 정비 주기 (시간)
     pm_duration_hours: float            # PM 소요 시간
     annual_pm_count: int                # 연간 PM 횟수
-    consumables_per_pm: list[str]       # PM 시 교체 부품
+    consumables_per_pm: tuple[str, ...] # PM 시 교체 부품
     major_overhaul_interval_months: int # 대정비 주기 (월)
     major_overhaul_duration_days: int   # 대정비 소요 일수
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EquipmentSpec:
     """장비 사양"""
     name: str
@@ -64,7 +96,7 @@ class EquipmentSpec:
 
     # Performance
     throughput_wph: int                         # Wafers per Hour
-    process_capability: list[str]               # 처리 가능 공정
+    process_capability: tuple[str, ...]         # 처리 가능 공정
     min_node_nm: int                            # 최소 지원 노드
 
     # Physical
@@ -77,7 +109,14 @@ class EquipmentSpec:
     mtbf_hours: int                             # Mean Time Between Failures
     mttr_hours: float                           # Mean Time To Repair
     annual_uptime_pct: float                    # 연간 가동률
-    maintenance: MaintenanceProfile
+
+    # Maintenance (MaintenanceProfile 필드를 인라인)
+    maint_pm_interval_hours: int                # 예방 정비 주기 (시간)
+    maint_pm_duration_hours: float              # PM 소요 시간
+    maint_annual_pm_count: int                  # 연간 PM 횟수
+    consumables_per_pm: tuple[str, ...]         # PM 시 교체 부품
+    maint_major_overhaul_interval_months: int   # 대정비 주기 (월)
+    maint_major_overhaul_duration_days: int     # 대정비 소요 일수
 
     # Cost
     purchase_price_million_usd: float
@@ -90,290 +129,471 @@ class EquipmentSpec:
 
     description: str = ""
 
+    def __post_init__(self):
+        object.__setattr__(self, "process_capability", tuple(self.process_capability))
+        object.__setattr__(self, "consumables_per_pm", tuple(self.consumables_per_pm))
+
+    @property
+    def maintenance(self) -> MaintenanceProfile:
+        return MaintenanceProfile(
+            self.maint_pm_interval_hours,
+            self.maint_pm_duration_hours,
+            self.maint_annual_pm_count,
+            self.consumables_per_pm,
+            self.maint_major_overhaul_interval_months,
+            self.maint_major_overhaul_duration_days,
+        )
+
 
 # ============================================================
 # Equipment Database
 # ============================================================
 
-EQUIPMENT_DB: dict[str, EquipmentSpec] = {
-    # === LITHOGRAPHY ===
-    "ASML_NXE3800E": EquipmentSpec(
-        name="ASML NXE:3800E",
-        model="NXE:3800E",
-        vendor=EquipmentVendorInfo("ASML", VendorRegion.NETHERLANDS, 100.0, True),
-        category=EquipCategory.LITHOGRAPHY,
-        throughput_wph=220,
-        process_capability=["EUV_SINGLE_EXPOSURE", "EUV_MULTI_PATTERNING"],
-        min_node_nm=3,
-        footprint_m2=120,
-        weight_tons=180,
-        power_consumption_kw=1200,
-        cleanroom_class="ISO Class 4",
-        mtbf_hours=500,
-        mttr_hours=8,
-        annual_uptime_pct=85,
-        maintenance=MaintenanceProfile(
-            pm_interval_hours=500,
-            pm_duration_hours=8,
-            annual_pm_count=17,
+@lru_cache(maxsize=1)
+def _equipment_db() -> Mapping[str, EquipmentSpec]:
+    return MappingProxyType({
+        # === LITHOGRAPHY ===
+        "ASML_NXE3800E": EquipmentSpec(
+            name="ASML NXE:3800E",
+            model="NXE:3800E",
+            vendor=EquipmentVendorInfo("ASML", VendorRegion.NETHERLANDS, 100.0, True),
+            category=EquipCategory.LITHOGRAPHY,
+            throughput_wph=220,
+            process_capability=["EUV_SINGLE_EXPOSURE", "EUV_MULTI_PATTERNING"],
+            min_node_nm=3,
+            footprint_m2=120,
+            weight_tons=180,
+            power_consumption_kw=1200,
+            cleanroom_class="ISO Class 4",
+            mtbf_hours=500,
+            mttr_hours=8,
+            annual_uptime_pct=85,
+            maint_pm_interval_hours=500,
+            maint_pm_duration_hours=8,
+            maint_annual_pm_count=17,
             consumables_per_pm=["Tin droplet generator", "Collector mirror", "Pellicle"],
-            major_overhaul_interval_months=12,
-            major_overhaul_duration_days=14
+            maint_major_overhaul_interval_months=12,
+            maint_major_overhaul_duration_days=14,
+            purchase_price_million_usd=380,
+            annual_maintenance_cost_usd=30_000_000,
+            consumables_annual_cost_usd=15_000_000,
+            lead_time_months=24,
+            annual_production_units=50,
+            description="최신 EUV 리소그래피, NA=0.33, 220 WPH. 전세계 유일 EUV 공급사"
         ),
-        purchase_price_million_usd=380,
-        annual_maintenance_cost_usd=30_000_000,
-        consumables_annual_cost_usd=15_000_000,
-        lead_time_months=24,
-        annual_production_units=50,
-        description="최신 EUV 리소그래피, NA=0.33, 220 WPH. 전세계 유일 EUV 공급사"
-    ),
-    "ASML_EXE5000": EquipmentSpec(
-        name="ASML EXE:5000 (High-NA EUV)",
-        model="EXE:5000",
-        vendor=EquipmentVendorInfo("ASML", VendorRegion.NETHERLANDS, 100.0, True),
-        category=EquipCategory.LITHOGRAPHY,
-        throughput_wph=185,
-        process_capability=["HIGH_NA_EUV", "SINGLE_EXPOSURE_2NM"],
-        min_node_nm=2,
-        footprint_m2=150,
-        weight_tons=250,
-        power_consumption_kw=1500,
-        cleanroom_class="ISO Class 4",
-        mtbf_hours=400,
-        mttr_hours=12,
-        annual_uptime_pct=80,
-        maintenance=MaintenanceProfile(
-            pm_interval_hours=400,
-            pm_duration_hours=12,
-            annual_pm_count=20,
+        "ASML_EXE5000": EquipmentSpec(
+            name="ASML EXE:5000 (High-NA EUV)",
+            model="EXE:5000",
+            vendor=EquipmentVendorInfo("ASML", VendorRegion.NETHERLANDS, 100.0, True),
+            category=EquipCategory.LITHOGRAPHY,
+            throughput_wph=185,
+            process_capability=["HIGH_NA_EUV", "SINGLE_EXPOSURE_2NM"],
+            min_node_nm=2,
+            footprint_m2=150,
+            weight_tons=250,
+            power_consumption_kw=1500,
+            cleanroom_class="ISO Class 4",
+            mtbf_hours=400,
+            mttr_hours=12,
+            annual_uptime_pct=80,
+            maint_pm_interval_hours=400,
+            maint_pm_duration_hours=12,
+            maint_annual_pm_count=20,
             consumables_per_pm=["Tin droplet generator", "Collector mirror", "High-NA optics"],
-            major_overhaul_interval_months=6,
-            major_overhaul_duration_days=21
+            maint_major_overhaul_interval_months=6,
+            maint_major_overhaul_duration_days=21,
+            purchase_price_million_usd=400,
+            annual_maintenance_cost_usd=40_000_000,
+            consumables_annual_cost_usd=20_000_000,
+            lead_time_months=36,
+            annual_production_units=20,
+            description="High-NA EUV (NA=0.55), 2nm 이하 싱글 패터닝. 2025 초도 출하"
         ),
-        purchase_price_million_usd=400,
-        annual_maintenance_cost_usd=40_000_000,
-        consumables_annual_cost_usd=20_000_000,
-        lead_time_months=36,
-        annual_production_units=20,
-        description="High-NA EUV (NA=0.55), 2nm 이하 싱글 패터닝. 2025 초도 출하"
-    ),
-
-    # === ETCH ===
-    "LAM_KIYO_FX": EquipmentSpec(
-        name="Lam Research Kiyo FX",
-        model="Kiyo FX",
-        vendor=EquipmentVendorInfo("Lam Research", VendorRegion.USA, 45.0),
-        category=EquipCategory.ETCH,
-        throughput_wph=120,
-        process_capability=["CONDUCTOR_ETCH", "DIELECTRIC_ETCH", "ALE"],
-        min_node_nm=3,
-        footprint_m2=25,
-        weight_tons=8,
-        power_consumption_kw=80,
-        cleanroom_class="ISO Class 5",
-        mtbf_hours=2000,
-        mttr_hours=4,
-        annual_uptime_pct=92,
-        maintenance=MaintenanceProfile(
-            pm_interval_hours=2000,
-            pm_duration_hours=4,
-            annual_pm_count=4,
+
+        # === ETCH ===
+        "LAM_KIYO_FX": EquipmentSpec(
+            name="Lam Research Kiyo FX",
+            model="Kiyo FX",
+            vendor=EquipmentVendorInfo("Lam Research", VendorRegion.USA, 45.0),
+            category=EquipCategory.ETCH,
+            throughput_wph=120,
+            process_capability=["CONDUCTOR_ETCH", "DIELECTRIC_ETCH", "ALE"],
+            min_node_nm=3,
+            footprint_m2=25,
+            weight_tons=8,
+            power_consumption_kw=80,
+            cleanroom_class="ISO Class 5",
+            mtbf_hours=2000,
+            mttr_hours=4,
+            annual_uptime_pct=92,
+            maint_pm_interval_hours=2000,
+            maint_pm_duration_hours=4,
+            maint_annual_pm_count=4,
             consumables_per_pm=["ESC (Electrostatic Chuck)", "Edge ring", "Gas distribution plate"],
-            major_overhaul_interval_months=18,
-            major_overhaul_duration_days=5
+            maint_major_overhaul_interval_months=18,
+            maint_major_overhaul_duration_days=5,
+            purchase_price_million_usd=8,
+            annual_maintenance_cost_usd=1_200_000,
+            consumables_annual_cost_usd=800_000,
+            lead_time_months=9,
+            annual_production_units=500,
+            description="첨단 로직/메모리 도체 식각 장비, ALE (Atomic Layer Etch) 지원"
         ),
-        purchase_price_million_usd=8,
-        annual_maintenance_cost_usd=1_200_000,
-        consumables_annual_cost_usd=800_000,
-        lead_time_months=9,
-        annual_production_units=500,
-        description="첨단 로직/메모리 도체 식각 장비, ALE (Atomic Layer Etch) 지원"
-    ),
-    "TEL_TACTRAS": EquipmentSpec(
-        name="Tokyo Electron Tactras",
-        model="Tactras",
-        vendor=EquipmentVendorInfo("Tokyo Electron (TEL)", VendorRegion.JAPAN, 30.0),
-        category=EquipCategory.ETCH,
-        throughput_wph=100,
-        process_capability=["CONDUCTOR_ETCH", "HAR_ETCH"],
-        min_node_nm=5,
-        footprint_m2=22,
-        weight_tons=7,
-        power_consumption_kw=70,
-        cleanroom_class="ISO Class 5",
-        mtbf_hours=2500,
-        mttr_hours=3,
-        annual_uptime_pct=93,
-        maintenance=MaintenanceProfile(
-            pm_interval_hours=2500,
-            pm_duration_hours=3,
-            annual_pm_count=3,
+        "TEL_TACTRAS": EquipmentSpec(
+            name="Tokyo Electron Tactras",
+            model="Tactras",
+            vendor=EquipmentVendorInfo("Tokyo Electron (TEL)", VendorRegion.JAPAN, 30.0),
+            category=EquipCategory.ETCH,
+            throughput_wph=100,
+            process_capability=["CONDUCTOR_ETCH", "HAR_ETCH"],
+            min_node_nm=5,
+            footprint_m2=22,
+            weight_tons=7,
+            power_consumption_kw=70,
+            cleanroom_class="ISO Class 5",
+            mtbf_hours=2500,
+            mttr_hours=3,
+            annual_uptime_pct=93,
+            maint_pm_interval_hours=2500,
+            maint_pm_duration_hours=3,
+            maint_annual_pm_count=3,
             consumables_per_pm=["Focus ring", "Upper electrode", "O-ring kit"],
-            major_overhaul_interval_months=18,
-            major_overhaul_duration_days=5
+            maint_major_overhaul_interval_months=18,
+            maint_major_overhaul_duration_days=5,
+            purchase_price_million_usd=7,
+            annual_maintenance_cost_usd=1_000_000,
+            consumables_annual_cost_usd=600_000,
+            lead_time_months=8,
+            annual_production_units=400,
+            description="고종횡비(HAR) 식각 전문, 3D NAND 핵심 장비"
         ),
-        purchase_price_million_usd=7,
-        annual_maintenance_cost_usd=1_000_000,
-        consumables_annual_cost_usd=600_000,
-        lead_time_months=8,
-        annual_production_units=400,
-        description="고종횡비(HAR) 식각 전문, 3D NAND 핵심 장비"
-    ),
-
-    # === DEPOSITION (CVD) ===
-    "AMAT_PRODUCER_GT": EquipmentSpec(
-        name="Applied Materials Producer GT",
-        model="Producer GT",
-        vendor=EquipmentVendorInfo("Applied Materials", VendorRegion.USA, 35.0),
-        category=EquipCategory.DEPOSITION,
-        throughput_wph=80,
-        process_capability=["PECVD", "SACVD", "FCVD", "LOW_K_CVD"],
-        min_node_nm=3,
-        footprint_m2=30,
-        weight_tons=10,
-        power_consumption_kw=100,
-        cleanroom_class="ISO Class 5",
-        mtbf_hours=3000,
-        mttr_hours=3,
-        annual_uptime_pct=94,
-        maintenance=MaintenanceProfile(
-            pm_interval_hours=3000,
-            pm_duration_hours=3,
-            annual_pm_count=3,
+
+        # === DEPOSITION (CVD) ===
+        "AMAT_PRODUCER_GT": EquipmentSpec(
+            name="Applied Materials Producer GT",
+            model="Producer GT",
+            vendor=EquipmentVendorInfo("Applied Materials", VendorRegion.USA, 35.0),
+            category=EquipCategory.DEPOSITION,
+            throughput_wph=80,
+            process_capability=["PECVD", "SACVD", "FCVD", "LOW_K_CVD"],
+            min_node_nm=3,
+            footprint_m2=30,
+            weight_tons=10,
+            power_consumption_kw=100,
+            cleanroom_class="ISO Class 5",
+            mtbf_hours=3000,
+            mttr_hours=3,
+            annual_uptime_pct=94,
+            maint_pm_interval_hours=3000,
+            maint_pm_duration_hours=3,
+            maint_annual_pm_count=3,
             consumables_per_pm=["Showerhead", "Heater", "Gas line kit"],
-            major_overhaul_interval_months=24,
-            major_overhaul_duration_days=7
+            maint_major_overhaul_interval_months=24,
+            maint_major_overhaul_duration_days=7,
+            purchase_price_million_usd=6,
+            annual_maintenance_cost_usd=900_000,
+            consumables_annual_cost_usd=500_000,
+            lead_time_months=6,
+            annual_production_units=800,
+            description="범용 CVD 증착, Low-k 절연막 증착 포함"
         ),
-        purchase_price_million_usd=6,
-        annual_maintenance_cost_usd=900_000,
-        consumables_annual_cost_usd=500_000,
-        lead_time_months=6,
-        annual_production_units=800,
-        description="범용 CVD 증착, Low-k 절연막 증착 포함"
-    ),
-
-    # === CMP ===
-    "AMAT_REFLEXION_LK": EquipmentSpec(
-        name="Applied Materials Reflexion LK Prime",
-        model="Reflexion LK Prime",
-        vendor=EquipmentVendorInfo("Applied Materials", VendorRegion.USA, 60.0),
-        category=EquipCategory.CMP,
-        throughput_wph=60,
-        process_capability=["OXIDE_CMP", "METAL_CMP", "STI_CMP", "BARRIER_CMP"],
-        min_node_nm=3,
-        footprint_m2=35,
-        weight_tons=12,
-        power_consumption_kw=60,
-        cleanroom_class="ISO Class 5",
-        mtbf_hours=2500,
-        mttr_hours=2,
-        annual_uptime_pct=93,
-        maintenance=MaintenanceProfile(
-            pm_interval_hours=2500,
-            pm_duration_hours=2,
-            annual_pm_count=3,
+
+        # === CMP ===
+        "AMAT_REFLEXION_LK": EquipmentSpec(
+            name="Applied Materials Reflexion LK Prime",
+            model="Reflexion LK Prime",
+            vendor=EquipmentVendorInfo("Applied Materials", VendorRegion.USA, 60.0),
+            category=EquipCategory.CMP,
+            throughput_wph=60,
+            process_capability=["OXIDE_CMP", "METAL_CMP", "STI_CMP", "BARRIER_CMP"],
+            min_node_nm=3,
+            footprint_m2=35,
+            weight_tons=12,
+            power_consumption_kw=60,
+            cleanroom_class="ISO Class 5",
+            mtbf_hours=2500,
+            mttr_hours=2,
+            annual_uptime_pct=93,
+            maint_pm_interval_hours=2500,
+            maint_pm_duration_hours=2,
+            maint_annual_pm_count=3,
             consumables_per_pm=["Polishing pad", "Slurry supply line", "Conditioning disk"],
-            major_overhaul_interval_months=12,
-            major_overhaul_duration_days=3
+            maint_major_overhaul_interval_months=12,
+            maint_major_overhaul_duration_days=3,
+            purchase_price_million_usd=5,
+            annual_maintenance_cost_usd=800_000,
+            consumables_annual_cost_usd=2_000_000,
+            lead_time_months=6,
+            annual_production_units=600,
+            description="다중 헤드 CMP, 연마 패드·슬러리 소모품 비용이 주요 운영비"
         ),
-        purchase_price_million_usd=5,
-        annual_maintenance_cost_usd=800_000,
-        consumables_annual_cost_usd=2_000_000,
-        lead_time_months=6,
-        annual_production_units=600,
-        description="다중 헤드 CMP, 연마 패드·슬러리 소모품 비용이 주요 운영비"
-    ),
-
-    # === METROLOGY ===
-    "KLA_8935": EquipmentSpec(
-        name="KLA 8935 Patterned Wafer Inspection",
-        model="8935",
-        vendor=EquipmentVendorInfo("KLA", VendorRegion.USA, 55.0),
-        category=EquipCategory.INSPECTION,
-        throughput_wph=40,
-        process_capability=["BRIGHTFIELD_INSPECTION", "DEFECT_DETECTION", "PATTERN_INSPECTION"],
-        min_node_nm=3,
-        footprint_m2=15,
-        weight_tons=5,
-        power_consumption_kw=30,
-        cleanroom_class="ISO Class 5",
-        mtbf_hours=4000,
-        mttr_hours=2,
-        annual_uptime_pct=96,
-        maintenance=MaintenanceProfile(
-            pm_interval_hours=4000,
-            pm_duration_hours=2,
-            annual_pm_count=2,
+
+        # === METROLOGY ===
+        "KLA_8935": EquipmentSpec(
+            name="KLA 8935 Patterned Wafer Inspection",
+            model="8935",
+            vendor=EquipmentVendorInfo("KLA", VendorRegion.USA, 55.0),
+            category=EquipCategory.INSPECTION,
+            throughput_wph=40,
+            process_capability=["BRIGHTFIELD_INSPECTION", "DEFECT_DETECTION", "PATTERN_INSPECTION"],
+            min_node_nm=3,
+            footprint_m2=15,
+            weight_tons=5,
+            power_consumption_kw=30,
+            cleanroom_class="ISO Class 5",
+            mtbf_hours=4000,
+            mttr_hours=2,
+            annual_uptime_pct=96,
+            maint_pm_interval_hours=4000,
+            maint_pm_duration_hours=2,
+            maint_annual_pm_count=2,
             consumables_per_pm=["Light source", "Optical calibration kit"],
-            major_overhaul_interval_months=24,
-            major_overhaul_duration_days=3
+            maint_major_overhaul_interval_months=24,
+            maint_major_overhaul_duration_days=3,
+            purchase_price_million_usd=15,
+            annual_maintenance_cost_usd=2_000_000,
+            consumables_annual_cost_usd=500_000,
+            lead_time_months=6,
+            annual_production_units=200,
+            description="Broadband plasma 광원 웨이퍼 검사, 3nm 결함 감지 지원"
         ),
-        purchase_price_million_usd=15,
-        annual_maintenance_cost_usd=2_000_000,
-        consumables_annual_cost_usd=500_000,
-        lead_time_months=6,
-        annual_production_units=200,
-        description="Broadband plasma 광원 웨이퍼 검사, 3nm 결함 감지 지원"
-    ),
-}
+    })
 
 
 # ============================================================
 # Vendor Market Share Summary
 # ============================================================
 
-VENDOR_MARKET_SHARE = {
-    EquipCategory.LITHOGRAPHY: {
-        "ASML": {"share_pct": 90, "products": ["EUV", "DUV (ArFi, KrF)"]},
-        "Nikon": {"share_pct": 7, "products": ["DUV (ArFi)"]},
-        "Canon": {"share_pct": 3, "products": ["DUV (KrF, i-line)"]},
-    },
-    EquipCategory.ETCH: {
-        "Lam Research": {"share_pct": 45, "products": ["Conductor/Dielectric Etch"]},
-        "Tokyo Electron": {"share_pct": 30, "products": ["HAR Etch"]},
-        "Applied Materials": {"share_pct": 20, "products": ["Etch"]},
-    },
-    EquipCategory.DEPOSITION: {
-        "Applied Materials": {"share_pct": 35, "products": ["CVD, PVD, EPI"]},
-        "Lam Research": {"share_pct": 25, "products": ["ALD, CVD"]},
-        "Tokyo Electron": {"share_pct": 20, "products": ["CVD, ALD"]},
-        "ASM International": {"share_pct": 15, "products": ["ALD specialist"]},
-    },
-    EquipCategory.CMP: {
-        "Applied Materials": {"share_pct": 60, "products": ["Reflexion series"]},
-        "Ebara": {"share_pct": 25, "products": ["FREX series"]},
-        "KCTECH": {"share_pct": 10, "products": ["CMP"]},
-    },
-    EquipCategory.INSPECTION: {
-        "KLA": {"share_pct": 55, "products": ["Broadband, E-beam"]},
-        "Applied Materials": {"share_pct": 20, "products": ["E-beam review"]},
-        "Hitachi High-Tech": {"share_pct": 15, "products": ["CD-SEM"]},
-    },
+class VendorShare(NamedTuple):
+    """카테고리 내 벤더 점유율 레코드"""
+    vendor: str
+    share_pct: int
+    products: tuple[str, ...]
+
+
+@lru_cache(maxsize=1)
+def _vendor_market_share() -> Mapping[EquipCategory, tuple[VendorShare, ...]]:
+    return MappingProxyType({
+        _CAT_LITHO: (
+            VendorShare("ASML", 90, ("EUV", "DUV (ArFi, KrF)")),
+            VendorShare("Nikon", 7, ("DUV (ArFi)",)),
+            VendorShare("Canon", 3, ("DUV (KrF, i-line)",)),
+        ),
+        _CAT_ETCH: (
+            VendorShare("Lam Research", 45, ("Conductor/Dielectric Etch",)),
+            VendorShare("Tokyo Electron", 30, ("HAR Etch",)),
+            VendorShare("Applied Materials", 20, ("Etch",)),
+        ),
+        _CAT_DEP: (
+            VendorShare("Applied Materials", 35, ("CVD, PVD, EPI",)),
+            VendorShare("Lam Research", 25, ("ALD, CVD",)),
+            VendorShare("Tokyo Electron", 20, ("CVD, ALD",)),
+            VendorShare("ASM International", 15, ("ALD specialist",)),
+        ),
+        _CAT_CMP: (
+            VendorShare("Applied Materials", 60, ("Reflexion series",)),
+            VendorShare("Ebara", 25, ("FREX series",)),
+            VendorShare("KCTECH", 10, ("CMP",)),
+        ),
+        _CAT_INSPECTION: (
+            VendorShare("KLA", 55, ("Broadband, E-beam",)),
+            VendorShare("Applied Materials", 20, ("E-beam review",)),
+            VendorShare("Hitachi High-Tech", 15, ("CD-SEM",)),
+        ),
+    })
+
+_EMPTY_SHARE: Final[tuple[VendorShare, ...]] = ()
+
+
+# ============================================================
+# Fab Capex Model
+# ============================================================
+
+# 50K WSPM 기준 노드별 Fab 장비 투자비 (million USD)
+FAB_BASE_CAPEX_MILLION_USD: Final[Mapping[int, int]] = MappingProxyType({
+    2: 30_000, 3: 22_000, 5: 17_000,
+    7: 12_000, 10: 8_000, 14: 5_000,
+})
+_DEFAULT_BASE_CAPEX_MILLION_USD: Final = 10_000
+_REFERENCE_WSPM: Final = 50000
+
+# (litho, etch/dep, metrology/inspection, other) 비율 — 5nm 이하는 EUV 비중 증가
+_CAPEX_SPLIT_ADVANCED: Final = (0.35, 0.30, 0.10, 1.0 - 0.35 - 0.30 - 0.10)
+_CAPEX_SPLIT_MATURE: Final = (0.25, 0.30, 0.10, 1.0 - 0.25 - 0.30 - 0.10)
+
+
+# ============================================================
+# Columnar View (분석용)
+# ============================================================
+
+# 숫자 컬럼은 array.array로 연속 메모리에 저장 (boxed int/float 대비 소형)
+EQUIP_NUMERIC_COLUMNS: Final[tuple[tuple[str, str], ...]] = (
+    ("throughput_wph", "H"),
+    ("min_node_nm", "B"),
+    ("mtbf_hours", "I"),
+    ("mttr_hours", "d"),
+    ("annual_uptime_pct", "d"),
+    ("purchase_price_million_usd", "d"),
+    ("annual_maintenance_cost_usd", "q"),
+    ("consumables_annual_cost_usd", "q"),
+    ("lead_time_months", "B"),
+)
+
+
+@lru_cache(maxsize=1)
+def equipment_table() -> MappingProxyType[str, Sequence]:
+    """
+    EQUIPMENT_DB의 컬럼 단위 뷰 (최초 호출 시 1회 생성)
+
+    처리량/투자비 비교, 벤더별 집계 등 전체 장비를 훑는 분석 쿼리용.
+    모든 컬럼은 같은 순서의 "key" 컬럼과 정렬되어 있다.
+    """
+    db = _equipment_db()
+    specs = tuple(db.values())
+    columns: dict[str, Sequence] = {
+        "key": tuple(db),
+        "name": tuple(e.name for e in specs),
+        "vendor": tuple(e.vendor.name for e in specs),
+        "category": tuple(e.category for e in specs),
+    }
+    for column, typecode in EQUIP_NUMERIC_COLUMNS:
+        columns[column] = array(typecode, [getattr(e, column) for e in specs])
+    return MappingProxyType(columns)
+
+
+@lru_cache(maxsize=1)
+def _by_category() -> Mapping[EquipCategory, tuple[EquipmentSpec, ...]]:
+    """카테고리 → 장비 역색인 (버킷은 EQUIPMENT_DB 삽입 순서)"""
+    index: dict[EquipCategory, list[EquipmentSpec]] = {}
+    for e in _equipment_db().values():
+        index.setdefault(e.category, []).append(e)
+    return MappingProxyType({cat: tuple(specs) for cat, specs in index.items()})
+
+
+@lru_cache(maxsize=1)
+def _by_category_sorted() -> Mapping[EquipCategory, tuple[EquipmentSpec, ...]]:
+    """카테고리 → 장비 역색인 (버킷은 min_node_nm 오름차순, bisect용)"""
+    return MappingProxyType({
+        cat: tuple(sorted(specs, key=lambda e: e.min_node_nm))
+        for cat, specs in _by_category().items()
+    })
+
+
+@lru_cache(maxsize=1)
+def _by_category_min_node() -> Mapping[EquipCategory, tuple[int, ...]]:
+    """_by_category_sorted 버킷과 나란한 min_node_nm 키 (bisect용)"""
+    return MappingProxyType({
+        cat: tuple(e.min_node_nm for e in specs)
+        for cat, specs in _by_category_sorted().items()
+    })
+
+
+# EquipmentSpec 에 인라인된 정비 필드 - 공개 응답에서는 "maintenance" 객체 하나로 노출
+_MAINTENANCE_FIELDS: Final[frozenset[str]] = frozenset({
+    "maint_pm_interval_hours",
+    "maint_pm_duration_hours",
+    "maint_annual_pm_count",
+    "consumables_per_pm",
+    "maint_major_overhaul_interval_months",
+    "maint_major_overhaul_duration_days",
+})
+
+
+def _equipment_payload(spec: EquipmentSpec) -> dict:
+    """공개 응답용 dict (인라인 정비 필드를 원래 위치의 maintenance 객체로 복원)"""
+    payload = {}
+    for key, value in asdict(spec).items():
+        if key in _MAINTENANCE_FIELDS:
+            if "maintenance" not in payload:
+                payload["maintenance"] = spec.maintenance._asdict()
+            continue
+        payload[key] = value
+    return payload
+
+
+@lru_cache(maxsize=1)
+def _equipment_json() -> Mapping[str, bytes]:
+    """장비별 JSON 직렬화 결과 (레코드가 불변이므로 1회만 직렬화)"""
+    return MappingProxyType({
+        key: json.dumps(_equipment_payload(spec), ensure_ascii=False).encode("utf-8")
+        for key, spec in _equipment_db().items()
+    })
+
+
+# ============================================================
+# Lazy Module Attributes (PEP 562)
+# ============================================================
+# 대형 테이블은 최초 접근 시 생성한다. 모듈 내부 코드는 캐시된 빌더를 직접 호출한다.
+
+EQUIPMENT_DB: Mapping[str, EquipmentSpec]
+VENDOR_MARKET_SHARE: Mapping[EquipCategory, tuple[VendorShare, ...]]
+
+_LAZY_TABLES: Final = {
+    "EQUIPMENT_DB": _equipment_db,
+    "VENDOR_MARKET_SHARE": _vendor_market_share,
 }
 
 
+def __getattr__(name: str):
+    builder = _LAZY_TABLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    table = globals()[name] = builder()
+    return table
+
+
 # ============================================================
 # Lookup Interface
 # ============================================================
 
 class EquipmentKnowledgeBase:
-    """장비 지식 베이스 인터페이스"""
+    """
+    장비 지식 베이스 인터페이스
 
-    @staticmethod
-    def get_all_equipment() -> dict[str, EquipmentSpec]:
-        return EQUIPMENT_DB
+    전체 장비 테이블은 모듈 상수 EQUIPMENT_DB를 직접 사용한다
+    (기존 get_all_equipment() 대체).
+    """
 
     @staticmethod
     def get_equipment(model_key: str) -> Optional[EquipmentSpec]:
-        return EQUIPMENT_DB.get(model_key)
+        return _equipment_db().get(model_key)
+
+    @staticmethod
+    def get_equipment_json(model_key: str) -> Optional[bytes]:
+        """장비 사양의 사전 직렬화된 JSON (UTF-8 bytes)"""
+        return _equipment_json().get(model_key)
 
     @staticmethod
-    def get_by_category(category: EquipCategory) -> list[EquipmentSpec]:
-        return [e for e in EQUIPMENT_DB.values() if e.category == category]
+    def get_by_category(category: EquipCategory) -> tuple[EquipmentSpec, ...]:
+        return _by_category().get(category, ())
 
     @staticmethod
-    def get_vendor_market_share(category: EquipCategory) -> dict:
-        return VENDOR_MARKET_SHARE.get(category, {})
+    def get_by_category_node(category: EquipCategory, node_nm: int) -> tuple[EquipmentSpec, ...]:
+        """카테고리 내에서 node_nm 공정을 지원하는 장비 (min_node_nm <= node_nm)"""
+        specs = _by_category_sorted().get(category, ())
+        return specs[:bisect_right(_by_category_min_node().get(category, ()), node_nm)]
+
+    @staticmethod
+    def query_by_throughput(min_wph: int) -> tuple[EquipmentSpec, ...]:
+        """처리량(WPH)이 min_wph 이상인 장비"""
+        table = equipment_table()
+        db = _equipment_db()
+        return tuple(db[k]
+                     for k, wph in zip(table["key"], table["throughput_wph"])
+                     if wph >= min_wph)
+
+    @staticmethod
+    def query_by_max_price(max_price_million_usd: float) -> tuple[EquipmentSpec, ...]:
+        """구매가가 max_price_million_usd 이하인 장비"""
+        table = equipment_table()
+        db = _equipment_db()
+        return tuple(db[k]
+                     for k, price in zip(table["key"], table["purchase_price_million_usd"])
+                     if price <= max_price_million_usd)
+
+    @staticmethod
+    def get_vendor_market_share(category: EquipCategory) -> tuple[VendorShare, ...]:
+        return _vendor_market_share().get(category, _EMPTY_SHARE)
 
     @staticmethod
     def estimate_fab_equipment_cost(
@@ -388,18 +608,11 @@ class EquipmentKnowledgeBase:
         - 3nm fab (50K WSPM): ~$20-25B
         - 2nm fab (50K WSPM): ~$28-35B
         """
-        base_costs = {
-            2: 30_000, 3: 22_000, 5: 17_000,
-            7: 12_000, 10: 8_000, 14: 5_000
-        }
-        base_million = base_costs.get(node_nm, 10_000)
-        scale_factor = wafer_starts_per_month / 50000
-
-        litho_pct = 0.35 if node_nm <= 5 else 0.25
-        etch_dep_pct = 0.30
-        other_pct = 1.0 - litho_pct - etch_dep_pct
-
-        total = base_million * scale_factor
+        base_million = FAB_BASE_CAPEX_MILLION_USD.get(node_nm, _DEFAULT_BASE_CAPEX_MILLION_USD)
+        total = base_million * (wafer_starts_per_month / _REFERENCE_WSPM)
+        litho_pct, etch_dep_pct, metrology_pct, other_pct = (
+            _CAPEX_SPLIT_ADVANCED if node_nm <= 5 else _CAPEX_SPLIT_MATURE
+        )
 
         return {
             "node_nm": node_nm,
@@ -408,8 +621,41 @@ class EquipmentKnowledgeBase:
             "breakdown": {
                 "lithography_million_usd": round(total * litho_pct),
                 "etch_deposition_million_usd": round(total * etch_dep_pct),
-                "metrology_inspection_million_usd": round(total * 0.10),
-                "other_million_usd": round(total * (other_pct - 0.10)),
+                "metrology_inspection_million_usd": round(total * metrology_pct),
+                "other_million_usd": round(total * other_pct),
             },
             "note": f"{node_nm}nm, {wafer_starts_per_month:,} WSPM 기준 추정"
         }
+
+    @staticmethod
+    def estimate_fab_equipment_cost_batch(
+        node_nms: Sequence[int],
+        wafer_starts_per_month: Sequence[int],
+    ) -> dict[str, list]:
+        """
+        Fab 장비 투자비 일괄 추정 (노드/WSPM 스윕용)
+
+        estimate_fab_equipment_cost와 동일한 모델을 컬럼 단위로 반환한다.
+        """
+        if len(node_nms) != len(wafer_starts_per_month):
+            raise ValueError("node_nms and wafer_starts_per_month must have the same length")
+
+        base_get = FAB_BASE_CAPEX_MILLION_USD.get
+        totals = [
+            base_get(node_nm, _DEFAULT_BASE_CAPEX_MILLION_USD) * (wspm / _REFERENCE_WSPM)
+            for node_nm, wspm in zip(node_nms, wafer_starts_per_month)
+        ]
+        splits = [
+            _CAPEX_SPLIT_ADVANCED if node_nm <= 5 else _CAPEX_SPLIT_MATURE
+            for node_nm in node_nms
+        ]
+
+        return {
+            "node_nm": list(node_nms),
+            "wspm": list(wafer_starts_per_month),
+            "total_capex_million_usd": [round(t) for t in totals],
+            "lithography_million_usd": [round(t * sp[0]) for t, sp in zip(totals, splits)],
+            "etch_deposition_million_usd": [round(t * sp[1]) for t, sp in zip(totals, splits)],
+            "metrology_inspection_million_usd": [round(t * sp[2]) for t, sp in zip(totals, splits)],
+            "other_million_usd": [round(t * sp[3]) for t, sp in zip(totals, splits)],
+        }
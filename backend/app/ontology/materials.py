@@ -9,11 +9,30 @@ Sources:
 - Industry supplier data
 """
 
+import re
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Iterator, Mapping, NamedTuple, Optional, Sequence
 from enum import Enum
 
 
+# "일본 70%", "JSR: 30%", "콩고민주공화국 원료 70%" 형태의 점유율 표기
+_SHARE_RE = re.compile(r"([가-힣A-Za-z][\w\-]*)(?:\s+원료)?\s*:?\s*(\d+(?:\.\d+)?)%")
+JAPAN_DEPENDENCY_THRESHOLD_PCT = 50
+
+# 동일한 공급사/공정 목록은 하나의 tuple 객체를 공유
+_SHARED_TUPLES: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _shared_tuple(values) -> tuple[str, ...]:
+    """문자열을 intern한 tuple을 반환 (내용이 같으면 동일 객체)"""
+    key = tuple(sys.intern(v) for v in values)
+    return _SHARED_TUPLES.setdefault(key, key)
+
+
 class MaterialCategory(str, Enum):
     WAFER = "WAFER"                     # 기판
     PHOTORESIST = "PHOTORESIST"         # 감광액
@@ -41,7 +60,7 @@ class SupplyRiskLevel(str, Enum):
     LOW = "LOW"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class MaterialSpec:
     """반도체 소재 사양"""
     name: str
@@ -51,11 +70,11 @@ class MaterialSpec:
     supply_risk: SupplyRiskLevel
 
     # 용도
-    process_steps: list[str]                    # 사용되는 공정 단계
+    process_steps: tuple[str, ...]              # 사용되는 공정 단계
     typical_purity: Optional[str] = None        # 순도 (e.g., "99.9999%", "SEMI Grade 5")
 
     # 공급망
-    major_suppliers: list[str] = field(default_factory=list)
+    major_suppliers: tuple[str, ...] = ()
     geographic_concentration: str = ""           # 주요 생산 지역
     lead_time_weeks: int = 4                    # 리드타임
     annual_consumption_per_fab: str = ""         # Fab당 연간 소비량 (대략)
@@ -71,202 +90,317 @@ class MaterialSpec:
 
     description: str = ""
 
+    # 파생 필드 (geographic_concentration에서 1회 파싱)
+    geographic_shares: dict[str, float] = field(init=False, default_factory=dict)
+    japan_dependent: bool = field(init=False, default=False)
+
+    def __post_init__(self):
+        self.process_steps = _shared_tuple(self.process_steps)
+        self.major_suppliers = _shared_tuple(self.major_suppliers)
+        shares: dict[str, float] = {}
+        for region, pct in _SHARE_RE.findall(self.geographic_concentration):
+            shares.setdefault(sys.intern(region), float(pct))
+        self.geographic_shares = shares
+        self.japan_dependent = shares.get("일본", 0.0) >= JAPAN_DEPENDENCY_THRESHOLD_PCT
+
 
 # ============================================================
 # Critical Materials Database
 # ============================================================
 
-MATERIALS: dict[str, MaterialSpec] = {
-    # --- Photoresists ---
-    "EUV_RESIST": MaterialSpec(
-        name="EUV Photoresist",
-        chemical_formula="CAR (Chemically Amplified Resist)",
-        category=MaterialCategory.PHOTORESIST,
-        criticality=CriticalityLevel.CRITICAL,
-        supply_risk=SupplyRiskLevel.VERY_HIGH,
-        process_steps=["EUV_LITHOGRAPHY"],
-        typical_purity="Particle < 50 per mL (≥0.1µm)",
-        major_suppliers=["JSR", "Tokyo Ohka Kogyo (TOK)", "Shin-Etsu Chemical", "Fujifilm"],
-        geographic_concentration="일본 100% (JSR: 30%, TOK: 25%, Shin-Etsu: 20%)",
-        lead_time_weeks=12,
-        annual_consumption_per_fab="200-500 리터/월",
-        unit_cost_range="$5,000-15,000/리터",
-        cost_trend="연 10-15% 상승 (EUV 전환 가속)",
-        export_controlled=True,
-        description="EUV 노광용 감광액, 일본 4사 독점. 2024년 JSR → JIC 인수로 공급 재편"
-    ),
-    "ArF_RESIST": MaterialSpec(
-        name="ArF Immersion Photoresist",
-        chemical_formula="ArF CAR",
-        category=MaterialCategory.PHOTORESIST,
-        criticality=CriticalityLevel.HIGH,
-        supply_risk=SupplyRiskLevel.HIGH,
-        process_steps=["DUV_LITHOGRAPHY", "IMMERSION_LITHOGRAPHY"],
-        typical_purity="Particle < 30 per mL (≥0.1µm)",
-        major_suppliers=["JSR", "TOK", "Dow Chemical", "Merck (AZ)"],
-        geographic_concentration="일본 70%, 미국 20%, 독일 10%",
-        lead_time_weeks=8,
-        annual_consumption_per_fab="500-1000 리터/월",
-        unit_cost_range="$2,000-5,000/리터",
-        cost_trend="안정 (성숙 기술)",
-        description="ArF (193nm) DUV 노광용, EUV 비적용 레이어에 계속 사용"
-    ),
-
-    # --- Process Gases ---
-    "NF3": MaterialSpec(
-        name="Nitrogen Trifluoride",
-        chemical_formula="NF₃",
-        category=MaterialCategory.GAS,
-        criticality=CriticalityLevel.HIGH,
-        supply_risk=SupplyRiskLevel.MEDIUM,
-        process_steps=["CVD_CHAMBER_CLEAN", "ETCH"],
-        typical_purity="99.999% (5N)",
-        major_suppliers=["SK Materials", "Kanto Denka", "Hyosung", "Linde"],
-        geographic_concentration="한국 40%, 일본 30%, 미국 20%",
-        lead_time_weeks=6,
-        annual_consumption_per_fab="300-600 톤/년",
-        unit_cost_range="$15-30/kg",
-        cost_trend="안정",
-        hazard_class="온실가스 (GWP: 17,200)",
-        description="CVD 챔버 세정용 불소 가스, 온실가스로 사용량 절감 추세"
-    ),
-    "SILANE": MaterialSpec(
-        name="Silane",
-        chemical_formula="SiH₄",
-        category=MaterialCategory.GAS,
-        criticality=CriticalityLevel.HIGH,
-        supply_risk=SupplyRiskLevel.MEDIUM,
-        process_steps=["CVD", "PECVD", "EPITAXY"],
-        typical_purity="99.9999% (6N)",
-        major_suppliers=["REC Silicon", "Tokuyama", "SK Materials", "Shin-Etsu"],
-        geographic_concentration="미국 30%, 일본 30%, 한국 25%",
-        lead_time_weeks=8,
-        annual_consumption_per_fab="100-300 톤/년",
-        unit_cost_range="$50-150/kg",
-        cost_trend="상승 (태양전지 수요 증가)",
-        hazard_class="자연 발화성 가스 (pyrophoric)",
-        description="실리콘 박막 증착용 핵심 가스, 태양전지 시장과 수요 경합"
-    ),
-    "WF6": MaterialSpec(
-        name="Tungsten Hexafluoride",
-        chemical_formula="WF₆",
-        category=MaterialCategory.GAS,
-        criticality=CriticalityLevel.CRITICAL,
-        supply_risk=SupplyRiskLevel.HIGH,
-        process_steps=["W_CVD", "CONTACT_FILL"],
-        typical_purity="99.999% (5N)",
-        major_suppliers=["Linde", "SK Materials", "Stella Chemifa"],
-        geographic_concentration="미국 30%, 한국 30%, 일본 25%",
-        lead_time_weeks=10,
-        annual_consumption_per_fab="50-150 톤/년",
-        unit_cost_range="$200-400/kg",
-        cost_trend="상승 (텅스텐 원자재 가격 연동)",
-        hazard_class="독성, 부식성",
-        description="텅스텐 배선 증착용, 3D NAND 고단화로 수요 급증"
-    ),
-
-    # --- Wet Chemicals ---
-    "HF": MaterialSpec(
-        name="Hydrofluoric Acid",
-        chemical_formula="HF",
-        category=MaterialCategory.CHEMICAL,
-        criticality=CriticalityLevel.HIGH,
-        supply_risk=SupplyRiskLevel.HIGH,
-        process_steps=["WET_ETCH", "CLEAN", "OXIDE_REMOVAL"],
-        typical_purity="SEMI Grade 4 (UP-SSSS)",
-        major_suppliers=["Stella Chemifa", "Morita Chemical", "Solvay", "Honeywell"],
-        geographic_concentration="일본 50% (형석 원료: 중국 60%)",
-        lead_time_weeks=8,
-        annual_consumption_per_fab="200-500 톤/년",
-        unit_cost_range="$500-2,000/톤",
-        cost_trend="불안정 (형석 가격 변동)",
-        hazard_class="맹독성, 부식성",
-        export_controlled=True,
-        description="실리콘 산화막 식각 핵심 화학물질, 일본 수출규제 대상 (2019)"
-    ),
-    "H2O2": MaterialSpec(
-        name="Hydrogen Peroxide (EL Grade)",
-        chemical_formula="H₂O₂",
-        category=MaterialCategory.CHEMICAL,
-        criticality=CriticalityLevel.MEDIUM,
-        supply_risk=SupplyRiskLevel.LOW,
-        process_steps=["SC1_CLEAN", "SC2_CLEAN", "SPM_CLEAN"],
-        typical_purity="SEMI Grade 5",
-        major_suppliers=["Evonik", "Mitsubishi Gas Chemical", "Solvay", "Arkema"],
-        geographic_concentration="글로벌 분산",
-        lead_time_weeks=4,
-        annual_consumption_per_fab="500-1500 톤/년",
-        unit_cost_range="$200-500/톤",
-        description="RCA 세정 (SC1/SC2)의 핵심 성분"
-    ),
-
-    # --- CMP ---
-    "CMP_OXIDE_SLURRY": MaterialSpec(
-        name="CMP Oxide Slurry (Ceria-based)",
-        chemical_formula="CeO₂ based",
-        category=MaterialCategory.CMP_SLURRY,
-        criticality=CriticalityLevel.CRITICAL,
-        supply_risk=SupplyRiskLevel.VERY_HIGH,
-        process_steps=["CMP_STI", "CMP_ILD", "CMP_OXIDE"],
-        major_suppliers=["CMC Materials (Entegris)", "Fujimi", "Hitachi Chemical"],
-        geographic_concentration="미국 40%, 일본 40%",
-        lead_time_weeks=8,
-        annual_consumption_per_fab="100-300 톤/년",
-        unit_cost_range="$50-200/kg",
-        cost_trend="상승 (세리아 희토류 가격 연동)",
-        description="산화막 CMP 연마용, 세리아(CeO₂) 기반 슬러리. 희토류 의존"
-    ),
-
-    # --- Photomask ---
-    "EUV_MASK_BLANK": MaterialSpec(
-        name="EUV Mask Blank",
-        chemical_formula="Mo/Si 다층막 on Quartz",
-        category=MaterialCategory.MASK,
-        criticality=CriticalityLevel.CRITICAL,
-        supply_risk=SupplyRiskLevel.VERY_HIGH,
-        process_steps=["EUV_LITHOGRAPHY"],
-        major_suppliers=["AGC (Asahi Glass)", "Hoya"],
-        geographic_concentration="일본 100% (AGC 70%, Hoya 30%)",
-        lead_time_weeks=16,
-        unit_cost_range="$300,000-500,000/장",
-        cost_trend="안정 (독점 시장)",
-        description="EUV 마스크 기판, Mo/Si 40쌍 다층 반사막. 전세계 2개사 독점"
-    ),
-
-    # --- Metal Targets ---
-    "COBALT_TARGET": MaterialSpec(
-        name="Cobalt Sputtering Target",
-        chemical_formula="Co",
-        category=MaterialCategory.METAL_TARGET,
-        criticality=CriticalityLevel.HIGH,
-        supply_risk=SupplyRiskLevel.HIGH,
-        process_steps=["PVD_BARRIER", "CONTACT"],
-        typical_purity="99.9999% (6N)",
-        major_suppliers=["Tosoh", "JX Nippon Mining", "Praxair"],
-        geographic_concentration="콩고민주공화국 원료 70%",
-        lead_time_weeks=12,
-        unit_cost_range="$5,000-15,000/타겟",
-        cost_trend="불안정 (DRC 정치 리스크)",
-        description="10nm 이하 배선 배리어/라이너, Cu→Co 전환 추세"
-    ),
-    "RUTHENIUM_TARGET": MaterialSpec(
-        name="Ruthenium Sputtering Target",
-        chemical_formula="Ru",
-        category=MaterialCategory.METAL_TARGET,
-        criticality=CriticalityLevel.CRITICAL,
-        supply_risk=SupplyRiskLevel.VERY_HIGH,
-        process_steps=["PVD_LINER", "EUV_PELLICLE"],
-        typical_purity="99.999% (5N)",
-        major_suppliers=["Heraeus", "Furuya Metal"],
-        geographic_concentration="남아프리카공화국 원료 90%",
-        lead_time_weeks=16,
-        unit_cost_range="$10,000-50,000/타겟",
-        cost_trend="급상승 (EUV 펠리클 수요)",
-        description="차세대 배선 라이너 + EUV 펠리클 소재, 남아공 의존도 극대"
-    ),
+@lru_cache(maxsize=1)
+def _materials() -> Mapping[str, MaterialSpec]:
+    return MappingProxyType({
+        # --- Photoresists ---
+        "EUV_RESIST": MaterialSpec(
+            name="EUV Photoresist",
+            chemical_formula="CAR (Chemically Amplified Resist)",
+            category=MaterialCategory.PHOTORESIST,
+            criticality=CriticalityLevel.CRITICAL,
+            supply_risk=SupplyRiskLevel.VERY_HIGH,
+            process_steps=["EUV_LITHOGRAPHY"],
+            typical_purity="Particle < 50 per mL (≥0.1µm)",
+            major_suppliers=["JSR", "Tokyo Ohka Kogyo (TOK)", "Shin-Etsu Chemical", "Fujifilm"],
+            geographic_concentration="일본 100% (JSR: 30%, TOK: 25%, Shin-Etsu: 20%)",
+            lead_time_weeks=12,
+            annual_consumption_per_fab="200-500 리터/월",
+            unit_cost_range="$5,000-15,000/리터",
+            cost_trend="연 10-15% 상승 (EUV 전환 가속)",
+            export_controlled=True,
+            description="EUV 노광용 감광액, 일본 4사 독점. 2024년 JSR → JIC 인수로 공급 재편"
+        ),
+        "ArF_RESIST": MaterialSpec(
+            name="ArF Immersion Photoresist",
+            chemical_formula="ArF CAR",
+            category=MaterialCategory.PHOTORESIST,
+            criticality=CriticalityLevel.HIGH,
+            supply_risk=SupplyRiskLevel.HIGH,
+            process_steps=["DUV_LITHOGRAPHY", "IMMERSION_LITHOGRAPHY"],
+            typical_purity="Particle < 30 per mL (≥0.1µm)",
+            major_suppliers=["JSR", "TOK", "Dow Chemical", "Merck (AZ)"],
+            geographic_concentration="일본 70%, 미국 20%, 독일 10%",
+            lead_time_weeks=8,
+            annual_consumption_per_fab="500-1000 리터/월",
+            unit_cost_range="$2,000-5,000/리터",
+            cost_trend="안정 (성숙 기술)",
+            description="ArF (193nm) DUV 노광용, EUV 비적용 레이어에 계속 사용"
+        ),
+
+        # --- Process Gases ---
+        "NF3": MaterialSpec(
+            name="Nitrogen Trifluoride",
+            chemical_formula="NF₃",
+            category=MaterialCategory.GAS,
+            criticality=CriticalityLevel.HIGH,
+            supply_risk=SupplyRiskLevel.MEDIUM,
+            process_steps=["CVD_CHAMBER_CLEAN", "ETCH"],
+            typical_purity="99.999% (5N)",
+            major_suppliers=["SK Materials", "Kanto Denka", "Hyosung", "Linde"],
+            geographic_concentration="한국 40%, 일본 30%, 미국 20%",
+            lead_time_weeks=6,
+            annual_consumption_per_fab="300-600 톤/년",
+            unit_cost_range="$15-30/kg",
+            cost_trend="안정",
+            hazard_class="온실가스 (GWP: 17,200)",
+            description="CVD 챔버 세정용 불소 가스, 온실가스로 사용량 절감 추세"
+        ),
+        "SILANE": MaterialSpec(
+            name="Silane",
+            chemical_formula="SiH₄",
+            category=MaterialCategory.GAS,
+            criticality=CriticalityLevel.HIGH,
+            supply_risk=SupplyRiskLevel.MEDIUM,
+            process_steps=["CVD", "PECVD", "EPITAXY"],
+            typical_purity="99.9999% (6N)",
+            major_suppliers=["REC Silicon", "Tokuyama", "SK Materials", "Shin-Etsu"],
+            geographic_concentration="미국 30%, 일본 30%, 한국 25%",
+            lead_time_weeks=8,
+            annual_consumption_per_fab="100-300 톤/년",
+            unit_cost_range="$50-150/kg",
+            cost_trend="상승 (태양전지 수요 증가)",
+            hazard_class="자연 발화성 가스 (pyrophoric)",
+            description="실리콘 박막 증착용 핵심 가스, 태양전지 시장과 수요 경합"
+        ),
+        "WF6": MaterialSpec(
+            name="Tungsten Hexafluoride",
+            chemical_formula="WF₆",
+            category=MaterialCategory.GAS,
+            criticality=CriticalityLevel.CRITICAL,
+            supply_risk=SupplyRiskLevel.HIGH,
+            process_steps=["W_CVD", "CONTACT_FILL"],
+            typical_purity="99.999% (5N)",
+            major_suppliers=["Linde", "SK Materials", "Stella Chemifa"],
+            geographic_concentration="미국 30%, 한국 30%, 일본 25%",
+            lead_time_weeks=10,
+            annual_consumption_per_fab="50-150 톤/년",
+            unit_cost_range="$200-400/kg",
+            cost_trend="상승 (텅스텐 원자재 가격 연동)",
+            hazard_class="독성, 부식성",
+            description="텅스텐 배선 증착용, 3D NAND 고단화로 수요 급증"
+        ),
+
+        # --- Wet Chemicals ---
+        "HF": MaterialSpec(
+            name="Hydrofluoric Acid",
+            chemical_formula="HF",
+            category=MaterialCategory.CHEMICAL,
+            criticality=CriticalityLevel.HIGH,
+            supply_risk=SupplyRiskLevel.HIGH,
+            process_steps=["WET_ETCH", "CLEAN", "OXIDE_REMOVAL"],
+            typical_purity="SEMI Grade 4 (UP-SSSS)",
+            major_suppliers=["Stella Chemifa", "Morita Chemical", "Solvay", "Honeywell"],
+            geographic_concentration="일본 50% (형석 원료: 중국 60%)",
+            lead_time_weeks=8,
+            annual_consumption_per_fab="200-500 톤/년",
+            unit_cost_range="$500-2,000/톤",
+            cost_trend="불안정 (형석 가격 변동)",
+            hazard_class="맹독성, 부식성",
+            export_controlled=True,
+            description="실리콘 산화막 식각 핵심 화학물질, 일본 수출규제 대상 (2019)"
+        ),
+        "H2O2": MaterialSpec(
+            name="Hydrogen Peroxide (EL Grade)",
+            chemical_formula="H₂O₂",
+            category=MaterialCategory.CHEMICAL,
+            criticality=CriticalityLevel.MEDIUM,
+            supply_risk=SupplyRiskLevel.LOW,
+            process_steps=["SC1_CLEAN", "SC2_CLEAN", "SPM_CLEAN"],
+            typical_purity="SEMI Grade 5",
+            major_suppliers=["Evonik", "Mitsubishi Gas Chemical", "Solvay", "Arkema"],
+            geographic_concentration="글로벌 분산",
+            lead_time_weeks=4,
+            annual_consumption_per_fab="500-1500 톤/년",
+            unit_cost_range="$200-500/톤",
+            description="RCA 세정 (SC1/SC2)의 핵심 성분"
+        ),
+
+        # --- CMP ---
+        "CMP_OXIDE_SLURRY": MaterialSpec(
+            name="CMP Oxide Slurry (Ceria-based)",
+            chemical_formula="CeO₂ based",
+            category=MaterialCategory.CMP_SLURRY,
+            criticality=CriticalityLevel.CRITICAL,
+            supply_risk=SupplyRiskLevel.VERY_HIGH,
+            process_steps=["CMP_STI", "CMP_ILD", "CMP_OXIDE"],
+            major_suppliers=["CMC Materials (Entegris)", "Fujimi", "Hitachi Chemical"],
+            geographic_concentration="미국 40%, 일본 40%",
+            lead_time_weeks=8,
+            annual_consumption_per_fab="100-300 톤/년",
+            unit_cost_range="$50-200/kg",
+            cost_trend="상승 (세리아 희토류 가격 연동)",
+            description="산화막 CMP 연마용, 세리아(CeO₂) 기반 슬러리. 희토류 의존"
+        ),
+
+        # --- Photomask ---
+        "EUV_MASK_BLANK": MaterialSpec(
+            name="EUV Mask Blank",
+            chemical_formula="Mo/Si 다층막 on Quartz",
+            category=MaterialCategory.MASK,
+            criticality=CriticalityLevel.CRITICAL,
+            supply_risk=SupplyRiskLevel.VERY_HIGH,
+            process_steps=["EUV_LITHOGRAPHY"],
+            major_suppliers=["AGC (Asahi Glass)", "Hoya"],
+            geographic_concentration="일본 100% (AGC 70%, Hoya 30%)",
+            lead_time_weeks=16,
+            unit_cost_range="$300,000-500,000/장",
+            cost_trend="안정 (독점 시장)",
+            description="EUV 마스크 기판, Mo/Si 40쌍 다층 반사막. 전세계 2개사 독점"
+        ),
+
+        # --- Metal Targets ---
+        "COBALT_TARGET": MaterialSpec(
+            name="Cobalt Sputtering Target",
+            chemical_formula="Co",
+            category=MaterialCategory.METAL_TARGET,
+            criticality=CriticalityLevel.HIGH,
+            supply_risk=SupplyRiskLevel.HIGH,
+            process_steps=["PVD_BARRIER", "CONTACT"],
+            typical_purity="99.9999% (6N)",
+            major_suppliers=["Tosoh", "JX Nippon Mining", "Praxair"],
+            geographic_concentration="콩고민주공화국 원료 70%",
+            lead_time_weeks=12,
+            unit_cost_range="$5,000-15,000/타겟",
+            cost_trend="불안정 (DRC 정치 리스크)",
+            description="10nm 이하 배선 배리어/라이너, Cu→Co 전환 추세"
+        ),
+        "RUTHENIUM_TARGET": MaterialSpec(
+            name="Ruthenium Sputtering Target",
+            chemical_formula="Ru",
+            category=MaterialCategory.METAL_TARGET,
+            criticality=CriticalityLevel.CRITICAL,
+            supply_risk=SupplyRiskLevel.VERY_HIGH,
+            process_steps=["PVD_LINER", "EUV_PELLICLE"],
+            typical_purity="99.999% (5N)",
+            major_suppliers=["Heraeus", "Furuya Metal"],
+            geographic_concentration="남아프리카공화국 원료 90%",
+            lead_time_weeks=16,
+            unit_cost_range="$10,000-50,000/타겟",
+            cost_trend="급상승 (EUV 펠리클 수요)",
+            description="차세대 배선 라이너 + EUV 펠리클 소재, 남아공 의존도 극대"
+        ),
+    })
+
+
+@lru_cache(maxsize=1)
+def _all_materials() -> tuple[MaterialSpec, ...]:
+    """전체 소재 목록 (호출마다 values()를 복사하지 않도록 1회 생성)"""
+    return tuple(_materials().values())
+
+
+# ============================================================
+# Precomputed Indexes
+# ============================================================
+
+class _MaterialIndexes(NamedTuple):
+    by_category: Mapping[MaterialCategory, tuple[MaterialSpec, ...]]
+    by_process: Mapping[str, tuple[MaterialSpec, ...]]
+    critical: tuple[MaterialSpec, ...]
+    high_risk: tuple[MaterialSpec, ...]
+    export_controlled: tuple[MaterialSpec, ...]
+    japan_dependent: tuple[MaterialSpec, ...]
+
+
+@lru_cache(maxsize=1)
+def _indexes() -> _MaterialIndexes:
+    by_category: dict[MaterialCategory, list[MaterialSpec]] = {}
+    by_process: dict[str, list[MaterialSpec]] = {}
+    critical, high_risk, export_controlled, japan_dependent = [], [], [], []
+
+    for m in _all_materials():
+        by_category.setdefault(m.category, []).append(m)
+        for step in m.process_steps:
+            by_process.setdefault(step, []).append(m)
+        if m.criticality is CriticalityLevel.CRITICAL:
+            critical.append(m)
+        if m.supply_risk in (SupplyRiskLevel.VERY_HIGH, SupplyRiskLevel.HIGH):
+            high_risk.append(m)
+        if m.export_controlled:
+            export_controlled.append(m)
+        if m.japan_dependent:
+            japan_dependent.append(m)
+
+    return _MaterialIndexes(
+        by_category=MappingProxyType({k: tuple(v) for k, v in by_category.items()}),
+        by_process=MappingProxyType({k: tuple(v) for k, v in by_process.items()}),
+        critical=tuple(critical),
+        high_risk=tuple(high_risk),
+        export_controlled=tuple(export_controlled),
+        japan_dependent=tuple(japan_dependent),
+    )
+
+
+# 공급 리스크 점수용 수치 인코딩
+_CRITICALITY_SCORE: Final[Mapping[CriticalityLevel, float]] = MappingProxyType({
+    CriticalityLevel.CRITICAL: 1.0,
+    CriticalityLevel.HIGH: 0.75,
+    CriticalityLevel.MEDIUM: 0.5,
+    CriticalityLevel.LOW: 0.25,
+})
+_SUPPLY_RISK_SCORE: Final[Mapping[SupplyRiskLevel, float]] = MappingProxyType({
+    SupplyRiskLevel.VERY_HIGH: 1.0,
+    SupplyRiskLevel.HIGH: 0.75,
+    SupplyRiskLevel.MEDIUM: 0.5,
+    SupplyRiskLevel.LOW: 0.25,
+})
+
+
+@lru_cache(maxsize=1)
+def _risk_features() -> tuple[tuple[str, ...], tuple[array, ...]]:
+    """
+    소재별 리스크 피처 (MATERIALS 키 순서의 병렬 배열)
+
+    열: criticality, supply_risk, japan_dependent, export_controlled
+    """
+    mats = _all_materials()
+    features = (
+        array("f", [_CRITICALITY_SCORE[m.criticality] for m in mats]),
+        array("f", [_SUPPLY_RISK_SCORE[m.supply_risk] for m in mats]),
+        array("f", [float(m.japan_dependent) for m in mats]),
+        array("f", [float(m.export_controlled) for m in mats]),
+    )
+    return tuple(_materials()), features
+
+
+# ============================================================
+# Lazy Module Attributes
+# ============================================================
+
+# 최초 접근 시 생성 (PEP 562)
+MATERIALS: Mapping[str, MaterialSpec]
+
+_LAZY_TABLES: Final = {
+    "MATERIALS": _materials,
 }
 
 
+def __getattr__(name: str):
+    builder = _LAZY_TABLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    table = globals()[name] = builder()
+    return table
+
+
 # ============================================================
 # Lookup Interface
 # ============================================================
@@ -275,40 +409,61 @@ class MaterialsKnowledgeBase:
     """소재 지식 베이스 인터페이스"""
 
     @staticmethod
-    def get_all_materials() -> dict[str, MaterialSpec]:
-        return MATERIALS
+    def get_all_materials() -> Mapping[str, MaterialSpec]:
+        return _materials()
+
+    @staticmethod
+    def get_all_values() -> tuple[MaterialSpec, ...]:
+        return _all_materials()
 
     @staticmethod
     def get_material(name: str) -> Optional[MaterialSpec]:
-        return MATERIALS.get(name)
+        return _materials().get(name)
+
+    @staticmethod
+    def get_by_category(category: MaterialCategory) -> tuple[MaterialSpec, ...]:
+        return _indexes().by_category.get(category, ())
 
     @staticmethod
-    def get_by_category(category: MaterialCategory) -> list[MaterialSpec]:
-        return [m for m in MATERIALS.values() if m.category == category]
+    def iter_by_category(category: MaterialCategory) -> Iterator[MaterialSpec]:
+        """카테고리별 소재 순회 (any()/next() 등 순회 전용 호출용)"""
+        return iter(_indexes().by_category.get(category, ()))
 
     @staticmethod
-    def get_critical_materials() -> list[MaterialSpec]:
-        return [m for m in MATERIALS.values()
-                if m.criticality == CriticalityLevel.CRITICAL]
+    def get_critical_materials() -> tuple[MaterialSpec, ...]:
+        return _indexes().critical
 
     @staticmethod
-    def get_high_risk_materials() -> list[MaterialSpec]:
-        return [m for m in MATERIALS.values()
-                if m.supply_risk in (SupplyRiskLevel.VERY_HIGH, SupplyRiskLevel.HIGH)]
+    def get_high_risk_materials() -> tuple[MaterialSpec, ...]:
+        return _indexes().high_risk
 
     @staticmethod
-    def get_export_controlled() -> list[MaterialSpec]:
-        return [m for m in MATERIALS.values() if m.export_controlled]
+    def get_export_controlled() -> tuple[MaterialSpec, ...]:
+        return _indexes().export_controlled
 
     @staticmethod
-    def get_japan_dependent() -> list[MaterialSpec]:
+    def get_japan_dependent() -> tuple[MaterialSpec, ...]:
         """일본 의존도가 높은 소재 (2019 수출규제 관련)"""
-        return [m for m in MATERIALS.values()
-                if "일본" in m.geographic_concentration
-                and any(pct in m.geographic_concentration
-                        for pct in ["100%", "70%", "80%", "90%", "50%"])]
+        return _indexes().japan_dependent
+
+    @staticmethod
+    def get_materials_for_process(process_step: str) -> tuple[MaterialSpec, ...]:
+        return _indexes().by_process.get(process_step, ())
 
     @staticmethod
-    def get_materials_for_process(process_step: str) -> list[MaterialSpec]:
-        return [m for m in MATERIALS.values()
-                if process_step in m.process_steps]
+    def rank_by_supply_risk(weights: Sequence[float] = (1.0, 1.0, 1.0, 1.0)) -> tuple[str, ...]:
+        """
+        가중 공급 리스크 점수 내림차순 소재 키
+
+        weights: (criticality, supply_risk, japan_dependent, export_controlled) 가중치
+        """
+        ids, features = _risk_features()
+        if len(weights) != len(features):
+            raise ValueError(f"Expected {len(features)} weights, got {len(weights)}")
+        w_crit, w_risk, w_japan, w_export = weights
+        scores = [
+            w_crit * c + w_risk * r + w_japan * j + w_export * e
+            for c, r, j, e in zip(*features)
+        ]
+        order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        return tuple(ids[i] for i in order)
@@ -9,8 +9,13 @@ Sources:
 - Published foundry data (TSMC, Samsung, Intel)
 """
 
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from math import exp, hypot, nan, pi
+from types import MappingProxyType
+from typing import Final, Mapping, Optional, Sequence
 from enum import Enum
 
 
@@ -27,7 +32,7 @@ class FoundryVendor(str, Enum):
     UMC = "UMC"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessNodeSpec:
     """공정 노드 사양 - IRDS 및 공개 데이터 기반"""
     name: str                           # 마케팅 이름 (e.g., "N3E")
@@ -63,9 +68,25 @@ class ProcessNodeSpec:
 
     description: str = ""
 
+    def __post_init__(self):
+        # 테이블 로드 시 1회 검증 - 조회/계산 경로에서는 범위 검사 생략
+        if self.node_nm <= 0:
+            raise ValueError(f"{self.name}: node_nm must be positive, got {self.node_nm}")
+        if not 0 <= self.typical_yield_pct <= 100:
+            raise ValueError(f"{self.name}: typical_yield_pct must be within 0-100, got {self.typical_yield_pct}")
+        if self.defect_density_per_cm2 < 0:
+            raise ValueError(f"{self.name}: defect_density_per_cm2 must be non-negative")
+        if not 0 <= self.euv_layers <= self.total_mask_layers:
+            raise ValueError(f"{self.name}: euv_layers must be within 0-total_mask_layers")
+        if self.volume_production_year < self.risk_production_year:
+            raise ValueError(f"{self.name}: volume_production_year precedes risk_production_year")
+
+        # 반복되는 분류 문자열은 intern하여 공유
+        object.__setattr__(self, "transistor_type", sys.intern(self.transistor_type))
+
 
 # TSMC Process Nodes (2024-2026 공개 데이터 기반)
-TSMC_NODES: dict[str, ProcessNodeSpec] = {
+TSMC_NODES: Final[Mapping[str, ProcessNodeSpec]] = MappingProxyType({
     "N3E": ProcessNodeSpec(
         name="N3E",
         node_nm=3,
@@ -234,11 +255,11 @@ TSMC_NODES: dict[str, ProcessNodeSpec] = {
         volume_production_year=2018,
         description="DUV 기반 성숙 노드 - AMD Zen2, Apple A12"
     ),
-}
+})
 
 
 # Samsung Process Nodes
-SAMSUNG_NODES: dict[str, ProcessNodeSpec] = {
+SAMSUNG_NODES: Final[Mapping[str, ProcessNodeSpec]] = MappingProxyType({
     "SF3": ProcessNodeSpec(
         name="SF3 (3GAE)",
         node_nm=3,
@@ -287,11 +308,11 @@ SAMSUNG_NODES: dict[str, ProcessNodeSpec] = {
         volume_production_year=2026,
         description="Samsung 2세대 GAA + 백사이드 파워, HBM 연계 최적화"
     ),
-}
+})
 
 
 # Intel Process Nodes
-INTEL_NODES: dict[str, ProcessNodeSpec] = {
+INTEL_NODES: Final[Mapping[str, ProcessNodeSpec]] = MappingProxyType({
     "Intel_18A": ProcessNodeSpec(
         name="Intel 18A",
         node_nm=1.8,
@@ -340,14 +361,106 @@ INTEL_NODES: dict[str, ProcessNodeSpec] = {
         volume_production_year=2025,
         description="Intel 최초 RibbonFET (GAA) 노드, Arrow Lake"
     ),
-}
+})
+
+# 전체 노드 통합 테이블 (조회마다 병합하지 않도록 1회 생성)
+_ALL_NODES: Final[Mapping[str, ProcessNodeSpec]] = MappingProxyType({
+    **TSMC_NODES,
+    **SAMSUNG_NODES,
+    **INTEL_NODES,
+})
+
+_VENDOR_MAP: Final[Mapping[FoundryVendor, Mapping[str, ProcessNodeSpec]]] = MappingProxyType({
+    FoundryVendor.TSMC: TSMC_NODES,
+    FoundryVendor.SAMSUNG: SAMSUNG_NODES,
+    FoundryVendor.INTEL: INTEL_NODES,
+})
+_EMPTY_NODES: Final[Mapping[str, ProcessNodeSpec]] = MappingProxyType({})
+
+
+def _index_by_nm() -> Mapping[float, tuple[ProcessNodeSpec, ...]]:
+    by_nm: dict[float, list[ProcessNodeSpec]] = {}
+    for n in _ALL_NODES.values():
+        by_nm.setdefault(n.node_nm, []).append(n)
+    return MappingProxyType({nm: tuple(nodes) for nm, nodes in by_nm.items()})
+
+
+_NODES_BY_NM: Final = _index_by_nm()
+
+
+def _normalize_node_name(name: str) -> str:
+    """별칭 비교용 정규화 - 대소문자/공백/구분자 무시 ("Intel 18A" == "intel_18a")"""
+    return name.lower().replace(" ", "").replace("_", "").replace("-", "")
+
+
+def _index_aliases() -> Mapping[str, ProcessNodeSpec]:
+    # 테이블 키와 마케팅 이름 모두 등록 (e.g., "SF3", "SF3 (3GAE)")
+    aliases: dict[str, ProcessNodeSpec] = {}
+    for key, n in _ALL_NODES.items():
+        aliases.setdefault(_normalize_node_name(key), n)
+        aliases.setdefault(_normalize_node_name(n.name), n)
+    return MappingProxyType(aliases)
+
+
+_NODE_ALIASES: Final = _index_aliases()
+
+
+# ============================================================
+# Columnar View (분석용)
+# ============================================================
+
+# 숫자 컬럼은 array.array로 연속 메모리에 저장 (미정의 실수 값은 NaN)
+# 정수 컬럼은 값 범위에 맞는 최소 폭 사용 (B: 0-255, H: 0-65535)
+NODE_NUMERIC_COLUMNS: Final[tuple[tuple[str, str], ...]] = (
+    ("node_nm", "d"),
+    ("actual_gate_length_nm", "d"),
+    ("metal_pitch_nm", "d"),
+    ("fin_pitch_nm", "d"),
+    ("gate_pitch_nm", "d"),
+    ("logic_density_mtr_per_mm2", "d"),
+    ("sram_cell_size_um2", "d"),
+    ("speed_improvement_pct", "d"),
+    ("power_reduction_pct", "d"),
+    ("density_improvement_pct", "d"),
+    ("euv_layers", "B"),
+    ("total_mask_layers", "B"),
+    ("wafer_cost_usd", "H"),
+    ("nre_cost_million_usd", "H"),
+    ("defect_density_per_cm2", "d"),
+    ("typical_yield_pct", "d"),
+    ("risk_production_year", "H"),
+    ("volume_production_year", "H"),
+)
+
+
+@lru_cache(maxsize=1)
+def node_table() -> MappingProxyType[str, Sequence]:
+    """
+    전체 공정 노드의 컬럼 단위 뷰 (최초 호출 시 1회 생성)
+
+    노드별 비용/밀도/수율 스윕 등 전체 노드를 훑는 분석 쿼리용.
+    모든 컬럼은 같은 순서의 "key" 컬럼과 정렬되어 있다.
+    """
+    specs = tuple(_ALL_NODES.values())
+    columns: dict[str, Sequence] = {
+        "key": tuple(_ALL_NODES),
+        "name": tuple(n.name for n in specs),
+        "vendor": tuple(n.vendor for n in specs),
+        "transistor_type": tuple(n.transistor_type for n in specs),
+    }
+    for column, typecode in NODE_NUMERIC_COLUMNS:
+        values = [getattr(n, column) for n in specs]
+        if typecode == "d":
+            values = [nan if v is None else v for v in values]
+        columns[column] = array(typecode, values)
+    return MappingProxyType(columns)
 
 
 # ============================================================
 # Wafer Specifications
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WaferSpec:
     """웨이퍼 사양"""
     diameter_mm: int
@@ -356,10 +469,14 @@ class WaferSpec:
     crystal_orientation: str
     resistivity_ohm_cm: tuple[float, float]
     edge_exclusion_mm: float
-    usable_area_mm2: float
+    usable_area_mm2: float              # 표시용 근사치 (다이 계산에는 r_effective_mm 사용)
+    r_effective_mm: float = field(init=False)   # 유효 반경 (d/2 - e), 생성 시 1회 계산
+
+    def __post_init__(self):
+        object.__setattr__(self, "r_effective_mm", self.diameter_mm / 2 - self.edge_exclusion_mm)
 
 
-WAFER_SPECS = {
+WAFER_SPECS: Final[Mapping[str, WaferSpec]] = MappingProxyType({
     "300mm": WaferSpec(
         diameter_mm=300,
         thickness_um=775,
@@ -378,14 +495,14 @@ WAFER_SPECS = {
         edge_exclusion_mm=3.0,
         usable_area_mm2=29_000
     ),
-}
+})
 
 
 # ============================================================
 # Packaging Technologies
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PackagingTech:
     """패키징 기술 사양"""
     name: str
@@ -397,11 +514,15 @@ class PackagingTech:
     typical_power_delivery_w: int
     die_size_limit_mm2: int
     cost_premium_vs_organic_pct: float
-    typical_applications: list[str]
+    typical_applications: tuple[str, ...]
     description: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "vendor", sys.intern(self.vendor))
+        object.__setattr__(self, "typical_applications", tuple(self.typical_applications))
 
-PACKAGING_TECHNOLOGIES = {
+
+PACKAGING_TECHNOLOGIES: Final[Mapping[str, PackagingTech]] = MappingProxyType({
     "CoWoS-S": PackagingTech(
         name="CoWoS-S",
         full_name="Chip-on-Wafer-on-Substrate (Silicon Interposer)",
@@ -480,14 +601,14 @@ PACKAGING_TECHNOLOGIES = {
         typical_applications=["HBM 통합 HPC"],
         description="Samsung 2.5D 실리콘 인터포저, HBM4 4스택"
     ),
-}
+})
 
 
 # ============================================================
 # Key Industry Metrics & Standards
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class YieldModelParams:
     """수율 모델 파라미터"""
     model_name: str
@@ -496,7 +617,7 @@ class YieldModelParams:
     die_area_sensitivity: str
 
 
-YIELD_MODELS = {
+YIELD_MODELS: Final[Mapping[str, YieldModelParams]] = MappingProxyType({
     "murphy": YieldModelParams(
         model_name="Murphy's Model",
         formula_description="Y = ((1 - exp(-A*D)) / (A*D))²",
@@ -515,11 +636,11 @@ YIELD_MODELS = {
         typical_defect_density_range=(0.01, 0.5),
         die_area_sensitivity="클러스터링 결함 모델, 가장 현실적"
     ),
-}
+})
 
 
 # OEE (Overall Equipment Effectiveness) - SEMI E10 표준
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OEEDefinition:
     """장비 종합 효율 정의 - SEMI E10"""
     metric: str
@@ -529,7 +650,7 @@ class OEEDefinition:
     description: str
 
 
-OEE_STANDARDS = {
+OEE_STANDARDS: Final[Mapping[str, OEEDefinition]] = MappingProxyType({
     "availability": OEEDefinition(
         metric="Availability",
         formula="(Scheduled Time - Downtime) / Scheduled Time",
@@ -558,7 +679,118 @@ OEE_STANDARDS = {
         typical_range_pct=(60, 90),
         description="종합 장비 효율, World-Class = 85%+"
     ),
-}
+})
+
+
+# ============================================================
+# Yield Sweep
+# ============================================================
+
+def calculate_yields(
+    die_areas_mm2: Sequence[float],
+    defect_densities: Sequence[float],
+    model: str = "poisson",
+    alpha: float = 3.0,
+) -> array:
+    """
+    (다이 면적, 결함 밀도) 쌍별 수율을 한 번에 계산 (YIELD_MODELS 공식)
+
+    die_areas_mm2: 다이 면적 (mm²), defect_densities: 결함 밀도 (defects/cm²)
+    alpha: negative_binomial 모델의 클러스터링 계수
+    """
+    if len(die_areas_mm2) != len(defect_densities):
+        raise ValueError("die_areas_mm2 and defect_densities must have the same length")
+    # mm² → cm² 환산 후 A*D
+    ad = [a / 100 * d for a, d in zip(die_areas_mm2, defect_densities)]
+
+    if model == "poisson":
+        return array("d", [exp(-x) for x in ad])
+    if model == "murphy":
+        return array("d", [((1 - exp(-x)) / x) ** 2 if x else 1.0 for x in ad])
+    if model == "negative_binomial":
+        return array("d", [(1 + x / alpha) ** -alpha for x in ad])
+    raise ValueError(f"Unknown yield model: {model}")
+
+
+# ============================================================
+# Die per Wafer
+# ============================================================
+
+@lru_cache(maxsize=2048)
+def calculate_gross_die_per_wafer(
+    die_width_mm: float,
+    die_height_mm: float,
+    wafer_diameter_mm: int = 300,
+    scribe_lane_mm: float = 0.1,
+    edge_exclusion_mm: float = 3.0
+) -> int:
+    """
+    웨이퍼당 총 다이 수 계산 (업계 표준 공식)
+
+    Gross Die = π * (d/2 - e)² / (W * H) - π * (d/2 - e) / √(W² + H²)
+    """
+    r = (wafer_diameter_mm / 2) - edge_exclusion_mm
+    return _gross_die(die_width_mm + scribe_lane_mm, die_height_mm + scribe_lane_mm, r)
+
+
+@lru_cache(maxsize=2048)
+def calculate_gross_die_for_wafer(
+    die_width_mm: float,
+    die_height_mm: float,
+    wafer: WaferSpec,
+    scribe_lane_mm: float = 0.1
+) -> int:
+    """WaferSpec 기준 웨이퍼당 총 다이 수 (사전 계산된 유효 반경 사용)"""
+    return _gross_die(die_width_mm + scribe_lane_mm, die_height_mm + scribe_lane_mm, wafer.r_effective_mm)
+
+
+def _gross_die(w: float, h: float, r: float) -> int:
+    # 표준 근사 공식 (π·r 공통항은 1회만 계산, 대각선은 hypot)
+    pi_r = pi * r
+    gross_die = int(pi_r * r / (w * h) - pi_r / hypot(w, h))
+    return max(0, gross_die)
+
+
+# ============================================================
+# Lookup Functions
+# ============================================================
+
+def get_all_nodes() -> Mapping[str, ProcessNodeSpec]:
+    """모든 공정 노드 조회"""
+    return _ALL_NODES
+
+
+def get_nodes_by_vendor(vendor: FoundryVendor) -> Mapping[str, ProcessNodeSpec]:
+    return _VENDOR_MAP.get(vendor, _EMPTY_NODES)
+
+
+def get_node(name: str) -> Optional[ProcessNodeSpec]:
+    """노드 조회 - 정확한 키 우선, 실패 시 정규화된 별칭으로 조회"""
+    return _ALL_NODES.get(name) or _NODE_ALIASES.get(_normalize_node_name(name))
+
+
+def get_nodes_by_nm(node_nm: int) -> tuple[ProcessNodeSpec, ...]:
+    return _NODES_BY_NM.get(node_nm, ())
+
+
+def get_packaging(name: str) -> Optional[PackagingTech]:
+    return PACKAGING_TECHNOLOGIES.get(name)
+
+
+def get_all_packaging() -> Mapping[str, PackagingTech]:
+    return PACKAGING_TECHNOLOGIES
+
+
+def get_wafer_spec(diameter: str = "300mm") -> WaferSpec:
+    return WAFER_SPECS.get(diameter, WAFER_SPECS["300mm"])
+
+
+def get_yield_model(name: str) -> Optional[YieldModelParams]:
+    return YIELD_MODELS.get(name)
+
+
+def get_oee_standards() -> Mapping[str, OEEDefinition]:
+    return OEE_STANDARDS
 
 
 # ============================================================
@@ -566,78 +798,17 @@ OEE_STANDARDS = {
 # ============================================================
 
 class SemiconductorOntology:
-    """반도체 도메인 온톨로지 통합 인터페이스"""
-
-    @staticmethod
-    def get_all_nodes() -> dict[str, ProcessNodeSpec]:
-        """모든 공정 노드 조회"""
-        all_nodes = {}
-        all_nodes.update(TSMC_NODES)
-        all_nodes.update(SAMSUNG_NODES)
-        all_nodes.update(INTEL_NODES)
-        return all_nodes
-
-    @staticmethod
-    def get_nodes_by_vendor(vendor: FoundryVendor) -> dict[str, ProcessNodeSpec]:
-        vendor_map = {
-            FoundryVendor.TSMC: TSMC_NODES,
-            FoundryVendor.SAMSUNG: SAMSUNG_NODES,
-            FoundryVendor.INTEL: INTEL_NODES,
-        }
-        return vendor_map.get(vendor, {})
-
-    @staticmethod
-    def get_node(name: str) -> Optional[ProcessNodeSpec]:
-        all_nodes = SemiconductorOntology.get_all_nodes()
-        return all_nodes.get(name)
-
-    @staticmethod
-    def get_nodes_by_nm(node_nm: int) -> list[ProcessNodeSpec]:
-        return [n for n in SemiconductorOntology.get_all_nodes().values()
-                if n.node_nm == node_nm]
-
-    @staticmethod
-    def get_packaging(name: str) -> Optional[PackagingTech]:
-        return PACKAGING_TECHNOLOGIES.get(name)
-
-    @staticmethod
-    def get_all_packaging() -> dict[str, PackagingTech]:
-        return PACKAGING_TECHNOLOGIES
-
-    @staticmethod
-    def get_wafer_spec(diameter: str = "300mm") -> WaferSpec:
-        return WAFER_SPECS.get(diameter, WAFER_SPECS["300mm"])
-
-    @staticmethod
-    def get_yield_model(name: str) -> Optional[YieldModelParams]:
-        return YIELD_MODELS.get(name)
-
-    @staticmethod
-    def get_oee_standards() -> dict[str, OEEDefinition]:
-        return OEE_STANDARDS
-
-    @staticmethod
-    def calculate_gross_die_per_wafer(
-        die_width_mm: float,
-        die_height_mm: float,
-        wafer_diameter_mm: int = 300,
-        scribe_lane_mm: float = 0.1,
-        edge_exclusion_mm: float = 3.0
-    ) -> int:
-        """
-        웨이퍼당 총 다이 수 계산 (업계 표준 공식)
-
-        Gross Die = π * (d/2 - e)² / (W * H) - π * (d/2 - e) / √(W² + H²)
-        """
-        import math
-        r = (wafer_diameter_mm / 2) - edge_exclusion_mm
-        w = die_width_mm + scribe_lane_mm
-        h = die_height_mm + scribe_lane_mm
-
-        # 표준 근사 공식
-        usable_area = math.pi * r * r
-        die_area = w * h
-        edge_loss = math.pi * r / math.sqrt(w * w + h * h)
-
-        gross_die = int(usable_area / die_area - edge_loss)
-        return max(0, gross_die)
+    """반도체 도메인 온톨로지 통합 인터페이스 (모듈 함수 re-export)"""
+
+    get_all_nodes = staticmethod(get_all_nodes)
+    get_nodes_by_vendor = staticmethod(get_nodes_by_vendor)
+    get_node = staticmethod(get_node)
+    get_nodes_by_nm = staticmethod(get_nodes_by_nm)
+    get_packaging = staticmethod(get_packaging)
+    get_all_packaging = staticmethod(get_all_packaging)
+    get_wafer_spec = staticmethod(get_wafer_spec)
+    get_yield_model = staticmethod(get_yield_model)
+    calculate_yields = staticmethod(calculate_yields)
+    get_oee_standards = staticmethod(get_oee_standards)
+    calculate_gross_die_per_wafer = staticmethod(calculate_gross_die_per_wafer)
+    calculate_gross_die_for_wafer = staticmethod(calculate_gross_die_for_wafer)
@@ -1,22 +1,31 @@
-from .ppa import (
-    ChipConfigRequest,
-    PPAResponse,
-    PPAAlternativesResponse,
-)
-from .cost import (
-    CostRequest,
-    CostResponse,
-    VolumeAnalysisResponse,
-)
-from .simulation import (
-    FullSimulationRequest,
-    FullSimulationResponse,
-    SimulationSummary,
-)
-from .reference import (
-    ProcessNodeResponse,
-    IPBlockResponse,
-)
+from importlib import import_module
+
+# 스키마 모듈은 최초 접근 시 import (PEP 562)
+# - 온톨로지만 사용하는 CLI/스크립트가 pydantic 모델 정의 비용을 지불하지 않도록
+_LAZY_EXPORTS = {
+    "ChipConfigRequest": ".ppa",
+    "PPAResponse": ".ppa",
+    "PPAAlternativesResponse": ".ppa",
+    "CostRequest": ".cost",
+    "CostResponse": ".cost",
+    "VolumeAnalysisResponse": ".cost",
+    "FullSimulationRequest": ".simulation",
+    "FullSimulationResponse": ".simulation",
+    "SimulationSummary": ".simulation",
+    "ProcessNodeResponse": ".reference",
+    "IPBlockResponse": ".reference",
+    "ProcessNodeListAdapter": ".reference",
+    "IPBlockListAdapter": ".reference",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module_name, __name__), name)
+    return value
+
 
 __all__ = [
     "ChipConfigRequest",
@@ -30,4 +39,6 @@ __all__ = [
     "SimulationSummary",
     "ProcessNodeResponse",
     "IPBlockResponse",
+    "ProcessNodeListAdapter",
+    "IPBlockListAdapter",
 ]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
@@ -9,15 +9,16 @@ class CostRequest(BaseModel):
     volume: int = Field(default=100000, ge=1000, description="연간 생산량")
     target_asp: float = Field(default=100.0, gt=0, description="목표 판매가 (USD)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "die_size_mm2": 127.5,
                 "process_node_nm": 5,
                 "volume": 100000,
                 "target_asp": 89.0
             }
-        }
+        },
+    )
 
 
 class CostResponse(BaseModel):
@@ -34,8 +35,8 @@ class CostResponse(BaseModel):
     net_die_per_wafer: int = Field(..., description="웨이퍼당 양품 다이 수")
     yield_rate: float = Field(..., description="수율 (%)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "wafer_cost": 16000.0,
                 "die_cost": 30.53,
@@ -49,7 +50,8 @@ class CostResponse(BaseModel):
                 "net_die_per_wafer": 524,
                 "yield_rate": 78.5
             }
-        }
+        },
+    )
 
 
 class VolumeEconomicsItem(BaseModel):
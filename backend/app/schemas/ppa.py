@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
@@ -14,8 +14,8 @@ class ChipConfigRequest(BaseModel):
     memory_channels: int = Field(default=2, ge=1, le=16, description="메모리 채널 수")
     target_frequency_ghz: float = Field(default=3.0, ge=1.0, le=6.0, description="목표 주파수 (GHz)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "process_node_nm": 5,
                 "cpu_cores": 8,
@@ -27,7 +27,8 @@ class ChipConfigRequest(BaseModel):
                 "memory_channels": 4,
                 "target_frequency_ghz": 3.2
             }
-        }
+        },
+    )
 
 
 class AreaBreakdown(BaseModel):
@@ -64,8 +65,8 @@ class PPAResponse(BaseModel):
     area_breakdown: AreaBreakdown
     power_breakdown: PowerBreakdown
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "die_size_mm2": 127.5,
                 "power_tdp_w": 45.2,
@@ -93,7 +94,8 @@ class PPAResponse(BaseModel):
                     "total": 45.2
                 }
             }
-        }
+        },
+    )
 
 
 class PPAAlternativeItem(BaseModel):
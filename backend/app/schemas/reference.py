@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional
 from datetime import datetime
 
@@ -17,9 +17,9 @@ class ProcessNodeResponse(BaseModel):
     max_frequency_ghz: float
     is_active: bool
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "5nm",
@@ -33,7 +33,8 @@ class ProcessNodeResponse(BaseModel):
                 "max_frequency_ghz": 3.5,
                 "is_active": True
             }
-        }
+        },
+    )
 
 
 class IPBlockResponse(BaseModel):
@@ -51,9 +52,9 @@ class IPBlockResponse(BaseModel):
     compatible_nodes: Optional[list[int]]
     description: Optional[str]
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "Cortex-A78",
@@ -68,4 +69,10 @@ class IPBlockResponse(BaseModel):
                 "compatible_nodes": [3, 5, 7],
                 "description": "High-performance CPU core"
             }
-        }
+        },
+    )
+
+
+# 목록 응답용 TypeAdapter - 목록 검증기를 모듈 로드 시 1회 생성해 재사용
+ProcessNodeListAdapter = TypeAdapter(list[ProcessNodeResponse])
+IPBlockListAdapter = TypeAdapter(list[IPBlockResponse])
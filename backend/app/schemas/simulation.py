@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
@@ -13,8 +13,8 @@ class FullSimulationRequest(BaseModel):
     volume: int = Field(default=100000, ge=1000, description="연간 생산량")
     target_asp: float = Field(default=100.0, gt=0, description="목표 판매가 (USD)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "AI Accelerator v1",
                 "config": {
@@ -31,7 +31,8 @@ class FullSimulationRequest(BaseModel):
                 "volume": 100000,
                 "target_asp": 150.0
             }
-        }
+        },
+    )
 
 
 class FullSimulationResponse(BaseModel):
@@ -44,8 +45,8 @@ class FullSimulationResponse(BaseModel):
     confidence_score: float
     created_at: datetime
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "name": "AI Accelerator v1",
@@ -86,7 +87,8 @@ class FullSimulationResponse(BaseModel):
                 "confidence_score": 90,
                 "created_at": "2024-01-15T10:30:00Z"
             }
-        }
+        },
+    )
 
 
 class SimulationSummary(BaseModel):
@@ -2,7 +2,7 @@
 What-If Simulation Schemas
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from enum import Enum
 
@@ -27,6 +27,8 @@ class AffectedNode(BaseModel):
     severity: str  # CRITICAL, HIGH, MEDIUM, LOW
     impact_reason: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class WhatIfResponse(BaseModel):
     scenario: dict
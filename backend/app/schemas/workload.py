@@ -4,7 +4,7 @@ Workload Analysis Pydantic Schemas
 워크로드 분석 API 요청/응답 스키마
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from enum import Enum
 
@@ -138,8 +138,8 @@ class WorkloadProfileRequest(BaseModel):
         description="워크로드 설명"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "LLM Inference - Llama-3 70B",
                 "workload_type": "AI_INFERENCE",
@@ -165,7 +165,8 @@ class WorkloadProfileRequest(BaseModel):
                     "volume_per_year": 50000
                 }
             }
-        }
+        },
+    )
 
 
 # Response Schemas
@@ -228,6 +229,8 @@ class WorkloadPresetSummary(BaseModel):
     category: str
     description: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class WorkloadPresetsResponse(BaseModel):
     """프리셋 목록 응답"""
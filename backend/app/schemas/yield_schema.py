@@ -4,7 +4,7 @@ Yield Schemas
 수율 관련 Pydantic 스키마
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -65,13 +65,12 @@ class WaferRecordResponse(WaferRecordBase):
     process_end: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Root Cause Schema
 class RootCause(BaseModel):
-    model_config = {"populate_by_name": True}
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     cause_type: RootCauseTypeEnum = Field(alias="type")
     entity_id: str = Field(..., description="관련 엔티티 ID (장비ID, 재료 배치ID 등)")
@@ -125,8 +124,7 @@ class YieldEventResponse(YieldEventBase):
     assigned_to: Optional[str] = None
     created_by: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Root Cause Analysis Schemas
@@ -155,6 +153,8 @@ class YieldTrendPoint(BaseModel):
     yield_percent: float
     wafer_count: int
 
+    model_config = ConfigDict(frozen=True)
+
 
 class YieldByEquipment(BaseModel):
     equipment_id: str
@@ -163,12 +163,16 @@ class YieldByEquipment(BaseModel):
     wafer_count: int
     trend: str  # UP, DOWN, STABLE
 
+    model_config = ConfigDict(frozen=True)
+
 
 class YieldByProduct(BaseModel):
     product_id: str
     avg_yield: float
     wafer_count: int
 
+    model_config = ConfigDict(frozen=True)
+
 
 class YieldDashboardResponse(BaseModel):
     """수율 대시보드 데이터"""
@@ -205,5 +209,4 @@ class EquipmentResponse(EquipmentBase):
     last_maintenance: Optional[datetime] = None
     next_maintenance: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -5,18 +5,348 @@ Role-Based + Attribute-Based Access Control (RBAC + ABAC)
 Palantir-grade Security Layer
 """
 
-from datetime import datetime
-from typing import Optional, Any
-from functools import wraps
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Optional, Any, Callable, Final, Mapping, Sequence
+from functools import lru_cache, wraps
 import hashlib
+import ipaddress
+import logging
 import re
+import secrets
+import threading
+import time
 
-from sqlalchemy.orm import Session
+from sqlalchemy import exists
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.security import (
     User, Role, AccessPolicy, AuditLog, DataMaskingRule
 )
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1024)
+def _compile_patterns(patterns: tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    와일드카드 리소스 패턴들 → 단일 정규식 (alternation)
+
+    패턴마다 fullmatch 를 반복하는 대신 한 번의 스캔으로 판정.
+    패턴이 없으면 None.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p.replace('*', '.*')})" for p in patterns))
+
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+
+_ANY_NETWORKS: tuple[IPNetwork, ...] = (
+    ipaddress.ip_network("0.0.0.0/0"),
+    ipaddress.ip_network("::/0"),
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_ip_ranges(ranges: tuple[str, ...]) -> tuple[IPNetwork, ...]:
+    """IP/CIDR 문자열 목록 → ip_network 튜플 ("*"는 전체 대역, 잘못된 항목은 무시)"""
+    networks: list[IPNetwork] = []
+    for ip_range in ranges:
+        if ip_range == "*":
+            networks.extend(_ANY_NETWORKS)
+            continue
+        try:
+            networks.append(ipaddress.ip_network(ip_range, strict=False))
+        except ValueError:
+            continue
+    return tuple(networks)
+
+
+@lru_cache(maxsize=1024)
+def _parse_ip(ip: str) -> Optional[IPAddress]:
+    try:
+        return ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+
+
+def _ip_in_networks(ip: str, networks: Sequence[IPNetwork]) -> bool:
+    """IP 범위 체크 (CIDR 포함 여부)"""
+    if not ip:
+        return False
+
+    addr = _parse_ip(ip)
+    if addr is None:
+        return False
+
+    return any(addr in network for network in networks)
+
+
+# ==================== 조건 컴파일 ====================
+# ABAC 조건(dict)을 정책 로드 시 (context, now) -> bool 함수로 변환
+# - 평가 시 type/operator 문자열 비교와 dict 조회를 반복하지 않음
+
+ConditionFn = Callable[[dict, float], bool]
+
+
+def _always(context: dict, now: float) -> bool:
+    return True
+
+
+def _as_members(value: Any) -> Any:
+    # 리스트 값은 frozenset으로 (O(1) in), 그 외는 원래 의미 유지
+    if isinstance(value, (list, tuple)):
+        return frozenset(value)
+    return value
+
+
+def _compile_condition(condition: dict) -> ConditionFn:
+    cond_type = condition.get("type")
+    operator = condition.get("operator", "EQUALS")
+    value = condition.get("value")
+
+    # 시간 조건
+    if cond_type == "TIME":
+        if operator == "BETWEEN":
+            start, end = value
+            return lambda context, now: start <= time.gmtime(now).tm_hour <= end
+        if operator == "IN":
+            hours = _as_members(value)
+            return lambda context, now: time.gmtime(now).tm_hour in hours
+
+    # IP 범위 조건
+    elif cond_type == "IP_RANGE":
+        networks = _parse_ip_ranges(tuple(value or ()))
+        return lambda context, now: _ip_in_networks(context.get("ip_address", ""), networks)
+
+    # 지역 조건
+    elif cond_type == "GEOGRAPHY":
+        regions = _as_members(value)
+        if operator == "IN":
+            return lambda context, now: context.get("geography", "") in regions
+        if operator == "NOT_IN":
+            return lambda context, now: context.get("geography", "") not in regions
+
+    # 계약 기간 조건
+    elif cond_type == "CONTRACT":
+        return lambda context, now: bool(context.get("contract_active", False))
+
+    # 알 수 없는 조건/연산자는 통과 (기존 동작 유지)
+    return _always
+
+
+# 조건 평가 비용 (낮을수록 먼저 평가) - 모든 조건이 AND이므로 순서는 결과에 영향 없음
+_CONDITION_COST = {"CONTRACT": 1, "TIME": 1, "GEOGRAPHY": 2, "IP_RANGE": 5}
+
+
+def _compile_conditions(conditions: Sequence[dict]) -> tuple[ConditionFn, ...]:
+    ordered = sorted(conditions, key=lambda c: _CONDITION_COST.get(c.get("type"), 0))
+    return tuple(_compile_condition(c) for c in ordered)
+
+
+def evaluate_conditions(
+    conditions: Sequence[dict],
+    context: dict,
+    now: Optional[float] = None
+) -> bool:
+    """ABAC 조건 평가 (컴파일되지 않은 dict 조건용, now: UTC epoch seconds)"""
+    if now is None:
+        now = time.time()
+    return all(_compile_condition(c)(context, now) for c in conditions)
+
+
+# ==================== 정책 컴파일 ====================
+
+@dataclass(slots=True, frozen=True)
+class CompiledPolicy:
+    """평가용으로 전처리된 접근 정책 (JSON 리스트 → set/정규식)"""
+    policy_id: str
+    name: str
+    match_all_resources: bool
+    exact_resources: frozenset[str]
+    resource_pattern: Optional[re.Pattern]
+    any_action: bool
+    actions: frozenset[str]
+    condition_fns: tuple[ConditionFn, ...]
+    valid_from_ts: Optional[float]      # UTC epoch seconds
+    valid_until_ts: Optional[float]
+
+    def is_valid(self, now: float) -> bool:
+        """정책 유효 기간 체크 (now: UTC epoch seconds)"""
+        if self.valid_from_ts is not None and now < self.valid_from_ts:
+            return False
+        if self.valid_until_ts is not None and now > self.valid_until_ts:
+            return False
+        return True
+
+    def matches_resource(self, requested: str) -> bool:
+        """리소스 패턴 매칭"""
+        if self.match_all_resources or requested in self.exact_resources:
+            return True
+        pattern = self.resource_pattern
+        return pattern is not None and pattern.fullmatch(requested) is not None
+
+    def allows_action(self, action: str) -> bool:
+        return self.any_action or action in self.actions
+
+    def conditions_met(self, context: dict, now: float) -> bool:
+        """ABAC 조건 평가"""
+        return all(fn(context, now) for fn in self.condition_fns)
+
+
+def _utc_timestamp(value: Optional[datetime]) -> Optional[float]:
+    """naive UTC datetime(DB 저장값) → epoch seconds"""
+    if not value:
+        return None
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def compile_policy(policy: AccessPolicy) -> CompiledPolicy:
+    """AccessPolicy 행을 CompiledPolicy로 변환"""
+    resources = policy.resources or []
+    actions = frozenset(policy.actions or ())
+    return CompiledPolicy(
+        policy_id=policy.policy_id,
+        name=policy.name,
+        match_all_resources="*" in resources,
+        exact_resources=frozenset(resources),
+        resource_pattern=_compile_patterns(
+            tuple(r for r in resources if "*" in r and r != "*")
+        ),
+        any_action="*" in actions,
+        actions=actions,
+        condition_fns=_compile_conditions(policy.conditions or ()),
+        valid_from_ts=_utc_timestamp(policy.valid_from),
+        valid_until_ts=_utc_timestamp(policy.valid_until),
+    )
+
+
+# 역할 → CompiledPolicy 인덱스 (활성 정책 전체를 1회 조회/컴파일해 구성)
+# - 정책 생성 시 무효화, 다른 프로세스의 변경은 TTL 경과 후 반영
+_POLICY_INDEX_TTL_SEC = 30.0
+
+_role_policy_index: dict[str, tuple[CompiledPolicy, ...]] = {}
+_role_policy_index_expires_at = 0.0
+
+
+def _get_role_policy_index(db: Session) -> dict[str, tuple[CompiledPolicy, ...]]:
+    global _role_policy_index, _role_policy_index_expires_at
+
+    if time.monotonic() < _role_policy_index_expires_at:
+        return _role_policy_index
+
+    by_role: dict[str, list[CompiledPolicy]] = {}
+    for policy in db.query(AccessPolicy).filter(AccessPolicy.is_active == True).all():
+        try:
+            compiled = compile_policy(policy)
+        except Exception:
+            # 잘못된 정책 행 하나가 전체 인덱스(모든 사용자의 접근 판정)를 깨지 않도록
+            # 해당 정책만 제외 (그 정책으로는 권한이 부여되지 않음)
+            logger.exception("Skipping malformed access policy %r", policy.policy_id)
+            continue
+        for role_name in dict.fromkeys(policy.roles or ()):
+            by_role.setdefault(role_name, []).append(compiled)
+
+    _role_policy_index = {name: tuple(policies) for name, policies in by_role.items()}
+    _role_policy_index_expires_at = time.monotonic() + _POLICY_INDEX_TTL_SEC
+    return _role_policy_index
+
+
+# ==================== 접근 결정 캐시 ====================
+# 엔진은 요청(DB 세션)마다 생성되므로 결정 캐시는 모듈 단위로 공유
+# - TTL 내에서는 시간 조건/정책 유효기간 변화가 최대 TTL만큼 늦게 반영됨
+
+_DECISION_TTL_SEC = 30.0
+_DECISION_CACHE_MAX = 10_000
+
+_ADMIN_ROLES = ("admin", "system_admin")
+
+# user_id → (만료 시각, 활성 관리자 여부) - 결정 캐시와 같은 TTL/크기 제한
+# (다른 프로세스/DB 직접 변경으로 관리자 권한이 회수돼도 최대 TTL 내 반영)
+_admin_flags: OrderedDict[int, tuple[float, bool]] = OrderedDict()
+
+_decision_cache: OrderedDict[tuple, tuple[float, tuple[bool, str]]] = OrderedDict()
+_decision_lock = threading.Lock()
+
+
+def _decision_key(
+    user_id: int,
+    resource: str,
+    action: str,
+    context: Optional[dict]
+) -> Optional[tuple]:
+    """캐시 키 생성 - 컨텍스트에 해시 불가 값이 있으면 None (캐시 생략)"""
+    try:
+        ctx = tuple(sorted(context.items())) if context else ()
+        hash(ctx)
+    except TypeError:
+        return None
+    return (user_id, resource, action, ctx)
+
+
+def _get_cached_decision(key: tuple) -> Optional[tuple[bool, str]]:
+    with _decision_lock:
+        entry = _decision_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, decision = entry
+        if expires_at < time.monotonic():
+            del _decision_cache[key]
+            return None
+        _decision_cache.move_to_end(key)
+        return decision
+
+
+def _store_decision(key: tuple, decision: tuple[bool, str]) -> None:
+    with _decision_lock:
+        _decision_cache[key] = (time.monotonic() + _DECISION_TTL_SEC, decision)
+        _decision_cache.move_to_end(key)
+        if len(_decision_cache) > _DECISION_CACHE_MAX:
+            _decision_cache.popitem(last=False)
+
+
+def _get_cached_admin_flag(user_id: int) -> Optional[bool]:
+    with _decision_lock:
+        entry = _admin_flags.get(user_id)
+        if entry is None:
+            return None
+        expires_at, flag = entry
+        if expires_at < time.monotonic():
+            del _admin_flags[user_id]
+            return None
+        _admin_flags.move_to_end(user_id)
+        return flag
+
+
+def _store_admin_flag(user_id: int, flag: bool) -> None:
+    with _decision_lock:
+        _admin_flags[user_id] = (time.monotonic() + _DECISION_TTL_SEC, flag)
+        _admin_flags.move_to_end(user_id)
+        if len(_admin_flags) > _DECISION_CACHE_MAX:
+            _admin_flags.popitem(last=False)
+
+
+def invalidate_user(user_id: int) -> None:
+    """특정 사용자의 캐시된 접근 결정 제거 (역할 변경/비활성화 시)"""
+    with _decision_lock:
+        for key in [k for k in _decision_cache if k[0] == user_id]:
+            del _decision_cache[key]
+        _admin_flags.pop(user_id, None)
+
+
+def clear_access_cache() -> None:
+    """캐시된 접근 결정/컴파일된 정책 전체 제거 (정책 변경 시)"""
+    global _role_policy_index_expires_at
+
+    with _decision_lock:
+        _decision_cache.clear()
+        _admin_flags.clear()
+    _role_policy_index_expires_at = 0.0
+
 
 class AccessControlEngine:
     """
@@ -55,14 +385,17 @@ class AccessControlEngine:
             roles = self.db.query(Role).filter(Role.name.in_(role_names)).all()
             user.roles = roles
 
+        # 사용자 + user_roles 행은 한 번의 flush/commit으로 저장
+        # (commit 후 만료된 속성은 접근 시 1회 재조회되므로 별도 refresh 생략)
         self.db.add(user)
         self.db.commit()
-        self.db.refresh(user)
         return user
 
     def get_user(self, user_id: int) -> Optional[User]:
-        """사용자 조회"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        """사용자 조회 (역할 함께 로드)"""
+        return self.db.query(User).options(
+            selectinload(User.roles)
+        ).filter(User.id == user_id).first()
 
     def get_user_by_username(self, username: str) -> Optional[User]:
         """사용자명으로 조회"""
@@ -82,6 +415,7 @@ class AccessControlEngine:
             if role not in user.roles:
                 user.roles.append(role)
                 self.db.commit()
+                invalidate_user(user_id)
             return True
         return False
 
@@ -93,6 +427,7 @@ class AccessControlEngine:
         if user and role and role in user.roles:
             user.roles.remove(role)
             self.db.commit()
+            invalidate_user(user_id)
             return True
         return False
 
@@ -141,10 +476,8 @@ class AccessControlEngine:
         valid_until: Optional[datetime] = None
     ) -> AccessPolicy:
         """접근 정책 생성"""
-        import uuid
-
         policy = AccessPolicy(
-            policy_id=f"POL-{uuid.uuid4().hex[:8].upper()}",
+            policy_id=f"POL-{secrets.token_hex(4).upper()}",
             name=name,
             description=description,
             roles=roles,
@@ -159,15 +492,26 @@ class AccessControlEngine:
         self.db.add(policy)
         self.db.commit()
         self.db.refresh(policy)
+        clear_access_cache()
         return policy
 
     def get_policies_for_role(self, role_name: str) -> list[AccessPolicy]:
         """역할에 적용되는 정책 목록"""
+        return self.get_policies_for_roles([role_name]).get(role_name, [])
+
+    def get_policies_for_roles(self, role_names: list[str]) -> dict[str, list[AccessPolicy]]:
+        """여러 역할의 정책을 한 번의 조회로 역할별 분류"""
         policies = self.db.query(AccessPolicy).filter(
             AccessPolicy.is_active == True
         ).all()
 
-        return [p for p in policies if role_name in p.roles]
+        # roles는 JSON 컬럼이므로 DB 측 배열 연산 대신 Python에서 분류
+        by_role: dict[str, list[AccessPolicy]] = {name: [] for name in role_names}
+        for policy in policies:
+            for name in policy.roles or ():
+                if name in by_role:
+                    by_role[name].append(policy)
+        return by_role
 
     # ==================== 접근 제어 ====================
 
@@ -190,6 +534,29 @@ class AccessControlEngine:
         Returns:
             (허용여부, 사유)
         """
+        key = _decision_key(user_id, resource, action, context)
+        if key is not None:
+            cached = _get_cached_decision(key)
+            if cached is not None:
+                return cached
+
+        decision = self._evaluate_access(user_id, resource, action, context)
+        if key is not None:
+            _store_decision(key, decision)
+        return decision
+
+    def _evaluate_access(
+        self,
+        user_id: int,
+        resource: str,
+        action: str,
+        context: Optional[dict]
+    ) -> tuple[bool, str]:
+        """접근 권한 평가 (캐시 미스 경로)"""
+        # Admin은 사용자/역할 로드 없이 바로 허용
+        if self._is_active_admin(user_id):
+            return True, "Admin access granted"
+
         user = self.get_user(user_id)
         if not user:
             return False, "User not found"
@@ -203,129 +570,50 @@ class AccessControlEngine:
         if not user_roles:
             return False, "User has no roles assigned"
 
-        # Admin은 항상 허용
-        if "admin" in user_roles or "system_admin" in user_roles:
-            return True, "Admin access granted"
-
-        # 역할별 정책 확인
+        # 역할별 정책 확인 (역할 인덱스의 컴파일된 정책으로 평가, 여러 역할에 걸친 정책은 1회만)
+        index = _get_role_policy_index(self.db)
+        seen: set[str] = set()
+        now = time.time()
         for role_name in user_roles:
-            policies = self.get_policies_for_role(role_name)
+            for compiled in index.get(role_name, ()):
+                if compiled.policy_id in seen:
+                    continue
+                seen.add(compiled.policy_id)
 
-            for policy in policies:
                 # 정책 유효 기간 체크
-                if not self._is_policy_valid(policy):
+                if not compiled.is_valid(now):
                     continue
 
-                # 리소스 매칭
-                if not self._match_resource(resource, policy.resources):
+                # 액션 매칭 (set 조회 - 정규식보다 먼저)
+                if not compiled.allows_action(action):
                     continue
 
-                # 액션 매칭
-                if action not in policy.actions and "*" not in policy.actions:
+                # 리소스 매칭
+                if not compiled.matches_resource(resource):
                     continue
 
                 # 조건 평가
-                if policy.conditions:
-                    if not self._evaluate_conditions(policy.conditions, context or {}):
+                if compiled.condition_fns:
+                    if not compiled.conditions_met(context or {}, now):
                         continue
 
-                return True, f"Access granted by policy: {policy.name}"
+                return True, f"Access granted by policy: {compiled.name}"
 
         return False, "No matching policy found"
 
-    def _is_policy_valid(self, policy: AccessPolicy) -> bool:
-        """정책 유효 기간 체크"""
-        now = datetime.utcnow()
-
-        if policy.valid_from and now < policy.valid_from:
-            return False
-
-        if policy.valid_until and now > policy.valid_until:
-            return False
-
-        return True
-
-    def _match_resource(self, requested: str, allowed: list[str]) -> bool:
-        """리소스 패턴 매칭"""
-        for pattern in allowed:
-            if pattern == "*":
-                return True
-
-            if pattern == requested:
-                return True
-
-            # 와일드카드 패턴 매칭
-            if "*" in pattern:
-                regex = pattern.replace("*", ".*")
-                if re.match(f"^{regex}$", requested):
-                    return True
-
-        return False
-
-    def _evaluate_conditions(
-        self,
-        conditions: list[dict],
-        context: dict
-    ) -> bool:
-        """ABAC 조건 평가"""
-        for condition in conditions:
-            cond_type = condition.get("type")
-            operator = condition.get("operator", "EQUALS")
-            value = condition.get("value")
-
-            # 시간 조건
-            if cond_type == "TIME":
-                current_hour = datetime.utcnow().hour
-                if operator == "BETWEEN":
-                    start, end = value
-                    if not (start <= current_hour <= end):
-                        return False
-                elif operator == "IN":
-                    if current_hour not in value:
-                        return False
-
-            # IP 범위 조건
-            elif cond_type == "IP_RANGE":
-                client_ip = context.get("ip_address", "")
-                if not self._check_ip_range(client_ip, value):
-                    return False
-
-            # 지역 조건
-            elif cond_type == "GEOGRAPHY":
-                client_geo = context.get("geography", "")
-                if operator == "IN":
-                    if client_geo not in value:
-                        return False
-                elif operator == "NOT_IN":
-                    if client_geo in value:
-                        return False
-
-            # 계약 기간 조건
-            elif cond_type == "CONTRACT":
-                contract_active = context.get("contract_active", False)
-                if not contract_active:
-                    return False
-
-        return True
-
-    def _check_ip_range(self, ip: str, allowed_ranges: list[str]) -> bool:
-        """IP 범위 체크"""
-        if not ip:
-            return False
-
-        for ip_range in allowed_ranges:
-            # CIDR 표기법 지원 (간단한 구현)
-            if "/" in ip_range:
-                # 실제로는 ipaddress 모듈 사용 권장
-                network = ip_range.split("/")[0]
-                if ip.startswith(network.rsplit(".", 1)[0]):
-                    return True
-            elif ip == ip_range:
-                return True
-            elif ip_range == "*":
-                return True
-
-        return False
+    def _is_active_admin(self, user_id: int) -> bool:
+        """활성 사용자이면서 관리자 역할 보유 여부 (사용자별 TTL 캐시)"""
+        flag = _get_cached_admin_flag(user_id)
+        if flag is None:
+            flag = bool(self.db.query(
+                exists().where(
+                    User.id == user_id,
+                    User.is_active == True,
+                    User.roles.any(Role.name.in_(_ADMIN_ROLES)),
+                )
+            ).scalar())
+            _store_admin_flag(user_id, flag)
+        return flag
 
     # ==================== 권한 편의 메서드 ====================
 
@@ -351,51 +639,83 @@ class AccessControlEngine:
 
 
 # ==================== 기본 역할 및 정책 초기화 ====================
+# 기본값은 모듈 로드 시 1회 생성하는 읽기 전용 상수 (초기화 호출마다 재생성하지 않음)
+
+_DEFAULT_ROLES: Final[tuple[Mapping[str, Any], ...]] = tuple(MappingProxyType(r) for r in (
+    {
+        "name": "admin",
+        "description": "시스템 관리자 - 전체 접근 권한",
+        "permissions": ("*",),
+        "level": 100
+    },
+    {
+        "name": "engineer",
+        "description": "엔지니어 - 수율/공정 데이터 접근",
+        "permissions": ("yield:read", "yield:write", "fab:read", "reports:read"),
+        "level": 50
+    },
+    {
+        "name": "operator",
+        "description": "운영자 - 읽기 전용 접근",
+        "permissions": ("yield:read", "fab:read", "reports:read"),
+        "level": 20
+    },
+    {
+        "name": "partner",
+        "description": "파트너사 - 제한된 접근 (마스킹 적용)",
+        "permissions": ("equipment:read:masked", "maintenance:read"),
+        "level": 10
+    },
+    {
+        "name": "auditor",
+        "description": "감사자 - 읽기 전용 + 감사 로그 접근",
+        "permissions": ("*:read", "audit:read"),
+        "level": 30
+    }
+))
+
+_DEFAULT_POLICIES: Final[tuple[Mapping[str, Any], ...]] = tuple(MappingProxyType(p) for p in (
+    {
+        "name": "Engineer Full Access",
+        "description": "엔지니어 수율/공정 전체 접근",
+        "roles": ("engineer", "admin"),
+        "resources": ("yield:*", "fab:*", "reports:*"),
+        "actions": ("VIEW", "EDIT", "EXPORT"),
+        "conditions": ()
+    },
+    {
+        "name": "Partner Limited Access",
+        "description": "파트너사 장비 상태 제한 접근",
+        "roles": ("partner",),
+        "resources": ("equipment:status", "maintenance:schedule"),
+        "actions": ("VIEW",),
+        "conditions": (
+            MappingProxyType({"type": "CONTRACT", "operator": "EQUALS", "value": True}),
+            MappingProxyType({"type": "TIME", "operator": "BETWEEN", "value": (9, 18)})
+        )
+    },
+    {
+        "name": "Operator Read Only",
+        "description": "운영자 읽기 전용 접근",
+        "roles": ("operator",),
+        "resources": ("yield:events", "yield:dashboard", "fab:status"),
+        "actions": ("VIEW",),
+        "conditions": ()
+    }
+))
+
 
 def initialize_default_roles(db: Session):
     """기본 역할 초기화"""
     ace = AccessControlEngine(db)
 
-    default_roles = [
-        {
-            "name": "admin",
-            "description": "시스템 관리자 - 전체 접근 권한",
-            "permissions": ["*"],
-            "level": 100
-        },
-        {
-            "name": "engineer",
-            "description": "엔지니어 - 수율/공정 데이터 접근",
-            "permissions": ["yield:read", "yield:write", "fab:read", "reports:read"],
-            "level": 50
-        },
-        {
-            "name": "operator",
-            "description": "운영자 - 읽기 전용 접근",
-            "permissions": ["yield:read", "fab:read", "reports:read"],
-            "level": 20
-        },
-        {
-            "name": "partner",
-            "description": "파트너사 - 제한된 접근 (마스킹 적용)",
-            "permissions": ["equipment:read:masked", "maintenance:read"],
-            "level": 10
-        },
-        {
-            "name": "auditor",
-            "description": "감사자 - 읽기 전용 + 감사 로그 접근",
-            "permissions": ["*:read", "audit:read"],
-            "level": 30
-        }
-    ]
-
-    for role_data in default_roles:
+    for role_data in _DEFAULT_ROLES:
         existing = ace.get_role(role_data["name"])
         if not existing:
             ace.create_role(
                 name=role_data["name"],
                 description=role_data["description"],
-                permissions=role_data["permissions"],
+                permissions=list(role_data["permissions"]),
                 level=role_data["level"]
             )
 
@@ -404,42 +724,16 @@ def initialize_default_policies(db: Session):
     """기본 접근 정책 초기화"""
     ace = AccessControlEngine(db)
 
-    default_policies = [
-        {
-            "name": "Engineer Full Access",
-            "description": "엔지니어 수율/공정 전체 접근",
-            "roles": ["engineer", "admin"],
-            "resources": ["yield:*", "fab:*", "reports:*"],
-            "actions": ["VIEW", "EDIT", "EXPORT"],
-            "conditions": []
-        },
-        {
-            "name": "Partner Limited Access",
-            "description": "파트너사 장비 상태 제한 접근",
-            "roles": ["partner"],
-            "resources": ["equipment:status", "maintenance:schedule"],
-            "actions": ["VIEW"],
-            "conditions": [
-                {"type": "CONTRACT", "operator": "EQUALS", "value": True},
-                {"type": "TIME", "operator": "BETWEEN", "value": [9, 18]}
-            ]
-        },
-        {
-            "name": "Operator Read Only",
-            "description": "운영자 읽기 전용 접근",
-            "roles": ["operator"],
-            "resources": ["yield:events", "yield:dashboard", "fab:status"],
-            "actions": ["VIEW"],
-            "conditions": []
-        }
-    ]
-
-    for policy_data in default_policies:
+    # ORM(JSON 컬럼)에는 상수와 공유되지 않는 list/dict 사본을 전달
+    for policy_data in _DEFAULT_POLICIES:
         ace.create_policy(
             name=policy_data["name"],
             description=policy_data["description"],
-            roles=policy_data["roles"],
-            resources=policy_data["resources"],
-            actions=policy_data["actions"],
-            conditions=policy_data.get("conditions")
+            roles=list(policy_data["roles"]),
+            resources=list(policy_data["resources"]),
+            actions=list(policy_data["actions"]),
+            conditions=[
+                {**c, "value": list(c["value"]) if isinstance(c["value"], tuple) else c["value"]}
+                for c in policy_data["conditions"]
+            ]
         )
@@ -4,15 +4,30 @@ AI Insight Service
 Claude API를 사용하여 그래프 쿼리 결과에 대한 도메인 분석을 생성합니다.
 """
 
+import hashlib
 import json
-from typing import AsyncGenerator
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncGenerator, Final, Mapping, Optional
 
 import anthropic
 
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 표준 json 사용 (SSE 청크 인코딩 전용)
+    orjson = None
+
 from ..config import get_settings
 
 settings = get_settings()
 
+# json.dumps(**옵션)은 호출마다 JSONEncoder를 새로 만들므로 인코더 인스턴스를 재사용
+_RESULTS_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2, default=str)
+_CHUNK_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))  # orjson 출력과 동일
+
 # 쿼리 타입별 시스템 프롬프트
 SYSTEM_PROMPT = """당신은 반도체 제조 공급망 전문 분석가입니다.
 Neo4j 그래프 데이터베이스의 쿼리 결과를 바탕으로, 반도체 공정/소재/장비 전문 지식을 활용하여
@@ -83,41 +98,155 @@ H100 생산과 EUV 소재 간의 의존 경로를 분석하고, 이 경로상의
 }
 
 
+@lru_cache(maxsize=1)
 def _get_client() -> anthropic.Anthropic:
+    """프로세스당 1개의 클라이언트를 재사용 (httpx 커넥션 풀/TLS 세션 유지)"""
     api_key = settings.anthropic_api_key
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY가 설정되지 않았습니다. .env 파일에 ANTHROPIC_API_KEY를 추가하세요.")
     return anthropic.Anthropic(api_key=api_key)
 
 
+def _reset_client() -> None:
+    """캐시된 클라이언트 폐기 (API 키 변경/테스트용)"""
+    _get_client.cache_clear()
+
+
+# 템플릿을 {results} 기준으로 미리 분리 (요청마다 str.format 파싱 생략)
+_PROMPT_PARTS: Final[Mapping[str, tuple[str, str]]] = MappingProxyType({
+    query_type: tuple(template.split("{results}", 1))
+    for query_type, template in PROMPT_TEMPLATES.items()
+})
+
+
+def _dumps_results(results: object) -> str:
+    """
+    쿼리 결과 → 들여쓰기 JSON
+
+    프롬프트 본문은 표준 json만 사용한다. orjson은 dict/str 하위 클래스,
+    64비트 초과 정수, NaN/Infinity 처리가 달라 설치 여부에 따라 프롬프트(=캐시 키)가 달라진다.
+    """
+    return _RESULTS_ENCODER.encode(results)
+
+
+# 프롬프트에 포함할 결과 JSON 최대 길이 (토큰 제한)
+_RESULTS_LIMIT = 8000
+
+
+def _bounded_results_json(results: object, limit: int = _RESULTS_LIMIT) -> str:
+    """
+    최상위 list/dict를 항목 단위로 직렬화하다가 limit을 넘으면 중단
+
+    항목을 1개짜리 컨테이너로 감싸 들여쓰기 JSON을 만든 뒤 괄호만 떼어 이어붙이므로
+    limit 이내 구간은 전체 직렬화 결과와 동일합니다.
+    """
+    if isinstance(results, dict) and results:
+        items = ({key: value} for key, value in results.items())
+        open_, close = "{", "\n}"
+    elif isinstance(results, (list, tuple)) and results:
+        items = ([value] for value in results)
+        open_, close = "[", "\n]"
+    else:
+        return _dumps_results(results)
+
+    parts = [open_]
+    size = 1
+    for i, item in enumerate(items):
+        part = ("\n" if i == 0 else ",\n") + _dumps_results(item)[2:-2]
+        parts.append(part)
+        size += len(part)
+        if size > limit:
+            return "".join(parts)
+    parts.append(close)
+    return "".join(parts)
+
+
+def _sse_chunk(text: str) -> bytes:
+    """스트리밍 텍스트 조각 → SSE data 이벤트"""
+    if orjson is not None:
+        return b"data: " + orjson.dumps({"chunk": text}) + b"\n\n"
+    return f"data: {_CHUNK_ENCODER.encode({'chunk': text})}\n\n".encode()
+
+
 def _build_prompt(query_type: str, results: object) -> str:
-    template = PROMPT_TEMPLATES.get(query_type, PROMPT_TEMPLATES["custom"])
-    results_str = json.dumps(results, ensure_ascii=False, indent=2, default=str)
-    # 토큰 제한을 위해 결과 크기 제한
-    if len(results_str) > 8000:
-        results_str = results_str[:8000] + "\n... (결과 일부 생략)"
-    return template.format(results=results_str)
+    prefix, suffix = _PROMPT_PARTS.get(query_type, _PROMPT_PARTS["custom"])
+    # 토큰 제한을 위해 결과 크기 제한 (잘릴 부분은 직렬화하지 않음)
+    results_str = _bounded_results_json(results)
+    if len(results_str) > _RESULTS_LIMIT:
+        results_str = results_str[:_RESULTS_LIMIT] + "\n... (결과 일부 생략)"
+    return prefix + results_str + suffix
+
+
+# ============================================================
+# Insight Cache
+# ============================================================
+# 동일 프롬프트(쿼리 타입 + 결과)에 대한 응답을 TTL 동안 재사용 - 유료/고지연 API 호출 절감
+
+_INSIGHT_TTL_SEC = 3600.0
+_INSIGHT_CACHE_MAX = 512
+
+_insight_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_insight_lock = threading.Lock()
+
+
+def _insight_key(user_prompt: str) -> str:
+    return hashlib.blake2b(user_prompt.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_insight(key: str) -> Optional[str]:
+    with _insight_lock:
+        entry = _insight_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, text = entry
+        if expires_at < time.monotonic():
+            del _insight_cache[key]
+            return None
+        _insight_cache.move_to_end(key)
+        return text
+
+
+def _store_insight(key: str, text: str) -> None:
+    with _insight_lock:
+        _insight_cache[key] = (time.monotonic() + _INSIGHT_TTL_SEC, text)
+        _insight_cache.move_to_end(key)
+        if len(_insight_cache) > _INSIGHT_CACHE_MAX:
+            _insight_cache.popitem(last=False)
 
 
 def generate_insight(query_type: str, results: object) -> str:
     """쿼리 결과에 대한 AI 인사이트를 생성합니다 (동기)."""
-    client = _get_client()
     user_prompt = _build_prompt(query_type, results)
+    key = _insight_key(user_prompt)
+    cached = _get_cached_insight(key)
+    if cached is not None:
+        return cached
 
+    client = _get_client()
     response = client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=2000,
         system=SYSTEM_PROMPT,
         messages=[{"role": "user", "content": user_prompt}],
     )
-    return response.content[0].text
+    text = response.content[0].text
+    _store_insight(key, text)
+    return text
 
 
-async def generate_insight_stream(query_type: str, results: object) -> AsyncGenerator[str, None]:
+async def generate_insight_stream(query_type: str, results: object) -> AsyncGenerator[bytes, None]:
     """쿼리 결과에 대한 AI 인사이트를 SSE 스트리밍으로 생성합니다."""
-    client = _get_client()
     user_prompt = _build_prompt(query_type, results)
+    key = _insight_key(user_prompt)
+    cached = _get_cached_insight(key)
+    if cached is not None:
+        # 캐시 적중 시 전체 텍스트를 한 번에 전송
+        yield _sse_chunk(cached)
+        yield b"data: [DONE]\n\n"
+        return
 
+    client = _get_client()
+    chunks: list[str] = []
     with client.messages.stream(
         model="claude-sonnet-4-20250514",
         max_tokens=2000,
@@ -125,6 +254,9 @@ async def generate_insight_stream(query_type: str, results: object) -> AsyncGene
         messages=[{"role": "user", "content": user_prompt}],
     ) as stream:
         for text in stream.text_stream:
-            yield f"data: {json.dumps({'chunk': text}, ensure_ascii=False)}\n\n"
+            chunks.append(text)
+            yield _sse_chunk(text)
 
-    yield "data: [DONE]\n\n"
+    # 스트림이 끝까지 완료된 경우에만 캐시 (클라이언트 중단 시 저장하지 않음)
+    _store_insight(key, "".join(chunks))
+    yield b"data: [DONE]\n\n"
@@ -5,16 +5,235 @@ Audit Logger Service
 Palantir-grade Audit Trail
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Any
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, Callable, Final, Iterator
+import csv
+import io
 import json
 import hashlib
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, or_, desc, func
 
 from app.models.security import AuditLog
 
+logger = logging.getLogger(__name__)
+
+
+# ==================== 배치 기록 큐 ====================
+# 로그마다 commit(fsync) 하면 요청 지연의 대부분을 차지하므로
+# 프로세스 내 큐에 쌓아두고 백그라운드 스레드가 묶어서 INSERT 한다.
+
+_FLUSH_BATCH_SIZE: Final[int] = 200
+_FLUSH_INTERVAL_SEC: Final[float] = 0.5
+_FLUSH_TIMEOUT_SEC: Final[float] = 10.0    # 종료 시 flush 최대 대기
+
+
+class _AuditQueue:
+    """감사 로그 배치 기록기 (데몬 스레드 1개)"""
+
+    def __init__(self):
+        self._queue: "queue.Queue[dict]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def put(self, entry: dict) -> None:
+        thread = self._thread
+        if (thread is None or not thread.is_alive()) and not self._start():
+            # 기록 스레드를 띄울 수 없으면 (인터프리터 종료 중 등) 호출 스레드에서 바로 기록
+            self._write([entry])
+            return
+        self._queue.put(entry)
+
+    def _start(self) -> bool:
+        """기록 스레드 시작 (죽은 경우 재시작), 실패 시 False"""
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            if self._thread is not None:
+                logger.error("Audit log flusher thread died; restarting")
+            thread = threading.Thread(
+                target=self._run, name="audit-log-flusher", daemon=True
+            )
+            try:
+                thread.start()
+            except RuntimeError:
+                logger.exception("Could not start audit log flusher thread")
+                return False
+            self._thread = thread
+            return True
+
+    def _run(self) -> None:
+        while True:
+            # 예기치 못한 오류로 스레드가 죽으면 큐가 무한정 쌓이므로 루프 본문 전체를 보호
+            try:
+                self._write_batch(self._drain(block=True))
+            except Exception:
+                logger.exception("Unexpected error in audit log flusher")
+
+    def _drain(self, block: bool) -> list[dict]:
+        """
+        최대 _FLUSH_BATCH_SIZE 건을 꺼냄
+
+        block 이면 첫 건이 올 때까지 기다린 뒤, 배치가 차거나
+        _FLUSH_INTERVAL_SEC 가 지날 때까지 추가로 모은다.
+        """
+        batch = []
+        if block:
+            batch.append(self._queue.get())
+            deadline = time.monotonic() + _FLUSH_INTERVAL_SEC
+            while len(batch) < _FLUSH_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            return batch
+
+        while len(batch) < _FLUSH_BATCH_SIZE:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: list[dict]) -> None:
+        try:
+            self._write(batch)
+        except Exception:
+            # 세션 생성 실패 등 _write 내부에서 처리되지 않은 오류 - 내용을 로그로 보존
+            logger.exception("Could not write %d audit logs: %r", len(batch), batch)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    @staticmethod
+    def _write(batch: list[dict]) -> None:
+        # 요청 세션과 분리된 전용 세션 사용 (스레드 간 세션 공유 금지)
+        from app.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            try:
+                db.bulk_insert_mappings(AuditLog, batch)
+                db.commit()
+                return
+            except Exception:
+                db.rollback()
+                logger.exception(
+                    "Batch insert of %d audit logs failed; retrying row by row", len(batch)
+                )
+
+            # 한 행의 오류로 배치 전체가 유실되지 않도록 행 단위로 재시도
+            for entry in batch:
+                try:
+                    db.bulk_insert_mappings(AuditLog, [entry])
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    # DB 에 남기지 못한 로그는 내용 전체를 애플리케이션 로그에 보존
+                    logger.exception("Could not write audit log: %r", entry)
+        finally:
+            db.close()
+
+    def flush(self, timeout: float = _FLUSH_TIMEOUT_SEC) -> bool:
+        """
+        큐에 남은 로그를 모두 기록 (종료 시 사용)
+
+        남은 로그는 호출 스레드에서 바로 기록하고,
+        백그라운드 스레드가 모으는 중인 배치는 최대 timeout 초까지 기다린다.
+        기한 내에 모두 기록되지 않으면 False.
+        """
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                break
+            self._write_batch(batch)
+
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        "Timed out flushing audit logs; %d entries pending",
+                        self._queue.unfinished_tasks,
+                    )
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+
+_audit_queue = _AuditQueue()
+
+
+def flush_audit_logs(timeout: float = _FLUSH_TIMEOUT_SEC) -> bool:
+    """대기 중인 감사 로그를 모두 기록 (timeout 초 내 완료 여부 반환)"""
+    return _audit_queue.flush(timeout)
+
+
+def _utcnow() -> datetime:
+    """
+    현재 UTC 시각 (tzinfo 없음)
+
+    audit_logs.timestamp 는 timezone 없는 DateTime 컬럼에 UTC 로 저장되므로
+    비교/저장 값도 naive UTC 로 맞춘다. (deprecated 된 datetime.utcnow 대체)
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# ==================== 로그 ID 생성 ====================
+# strftime 은 같은 초 안에서는 결과가 같으므로 초 단위로 캐시하고,
+# 접미사는 UUID 대신 "프로세스 태그 + 프로세스 내 단조 증가 카운터"를 사용한다.
+# 카운터는 프로세스마다 0부터 시작하므로 태그 없이는 워커/레플리카/재시작 간
+# 같은 초에 같은 ID가 생겨 log_id unique 제약에 걸린다.
+
+def _new_process_tag() -> str:
+    return os.urandom(4).hex().upper()
+
+
+_process_tag = _new_process_tag()
+_LOG_COUNTER = itertools.count()
+_log_id_prefix: tuple[Optional[datetime], str] = (None, "")
+
+
+def _reset_log_id_state() -> None:
+    """fork 된 자식 프로세스는 부모와 다른 태그/카운터 사용"""
+    global _process_tag, _LOG_COUNTER
+    _process_tag = _new_process_tag()
+    _LOG_COUNTER = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_log_id_state)
+
+
+def _make_log_id(now: datetime) -> str:
+    global _log_id_prefix
+    second = now.replace(microsecond=0)
+    cached_second, prefix = _log_id_prefix
+    if cached_second != second:
+        prefix = second.strftime("%Y%m%d%H%M%S")
+        _log_id_prefix = (second, prefix)
+    return f"LOG-{prefix}-{_process_tag}-{next(_LOG_COUNTER):06X}"
+
+
+# 내보내기 최대 행 수 / 서버측 커서 fetch 단위
+_EXPORT_LIMIT: Final[int] = 10000
+_EXPORT_CHUNK_SIZE: Final[int] = 500
+
+# 컴플라이언스 보고서에 포함되는 액션
+_PRIVILEGED_ACTIONS: Final[frozenset[str]] = frozenset({"DELETE", "ADMIN_ACTION"})
+_REPORTED_ACTIONS: Final[tuple[str, ...]] = ("SECURITY_EVENT", "EXPORT", "DELETE", "ADMIN_ACTION")
+
 
 class AuditLogger:
     """
@@ -45,7 +264,9 @@ class AuditLogger:
         details: Optional[dict] = None
     ) -> AuditLog:
         """
-        감사 로그 기록
+        감사 로그 기록 (배치 큐에 적재, 최대 _FLUSH_INTERVAL_SEC 후 DB 반영)
+
+        반환되는 AuditLog 는 세션에 속하지 않은 임시 객체이다.
 
         Args:
             user_id: 사용자 ID
@@ -58,27 +279,42 @@ class AuditLogger:
             user_agent: 브라우저/클라이언트 정보
             details: 추가 상세 정보
         """
-        import uuid
-
-        log_entry = AuditLog(
-            log_id=f"LOG-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6].upper()}",
-            timestamp=datetime.utcnow(),
-            user_id=user_id,
-            user_role=user_role,
-            action=action,
-            resource=resource,
-            resource_id=resource_id,
-            result=result,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            details=details
+        entry = self._build_entry(
+            user_id, user_role, action, resource, resource_id,
+            result, ip_address, user_agent, details
         )
+        _audit_queue.put(entry)
+
+        return AuditLog(**entry)
 
-        self.db.add(log_entry)
-        self.db.commit()
-        self.db.refresh(log_entry)
+    @staticmethod
+    def _build_entry(
+        user_id: int,
+        user_role: str,
+        action: str,
+        resource: str,
+        resource_id: Optional[str],
+        result: str,
+        ip_address: Optional[str],
+        user_agent: Optional[str],
+        details: Optional[dict]
+    ) -> dict:
+        """AuditLog 컬럼 매핑 생성"""
+        now = _utcnow()
 
-        return log_entry
+        return {
+            "log_id": _make_log_id(now),
+            "timestamp": now,
+            "user_id": user_id,
+            "user_role": user_role,
+            "action": action,
+            "resource": resource,
+            "resource_id": resource_id,
+            "result": result,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "details": details,
+        }
 
     def log_view(
         self,
@@ -297,7 +533,7 @@ class AuditLogger:
         days: int = 30
     ) -> list[AuditLog]:
         """특정 사용자의 활동 로그"""
-        start_date = datetime.utcnow() - timedelta(days=days)
+        start_date = _utcnow() - timedelta(days=days)
 
         return self.db.query(AuditLog).filter(
             and_(
@@ -326,7 +562,7 @@ class AuditLogger:
         days: int = 7
     ) -> list[AuditLog]:
         """보안 이벤트 조회"""
-        start_date = datetime.utcnow() - timedelta(days=days)
+        start_date = _utcnow() - timedelta(days=days)
 
         query = self.db.query(AuditLog).filter(
             and_(
@@ -336,9 +572,8 @@ class AuditLogger:
         )
 
         if severity:
-            # details JSON 필드에서 severity 필터링
-            # PostgreSQL jsonb 연산자 사용 가능
-            pass
+            # details JSON 필드의 severity 를 DB 에서 필터링 (PostgreSQL: details ->> 'severity')
+            query = query.filter(AuditLog.details["severity"].as_string() == severity)
 
         return query.order_by(desc(AuditLog.timestamp)).all()
 
@@ -347,7 +582,7 @@ class AuditLogger:
         hours: int = 24
     ) -> list[AuditLog]:
         """실패한 로그인 시도 조회"""
-        start_date = datetime.utcnow() - timedelta(hours=hours)
+        start_date = _utcnow() - timedelta(hours=hours)
 
         return self.db.query(AuditLog).filter(
             and_(
@@ -362,7 +597,7 @@ class AuditLogger:
         hours: int = 24
     ) -> list[AuditLog]:
         """접근 거부 이력 조회"""
-        start_date = datetime.utcnow() - timedelta(hours=hours)
+        start_date = _utcnow() - timedelta(hours=hours)
 
         return self.db.query(AuditLog).filter(
             and_(
@@ -377,42 +612,39 @@ class AuditLogger:
         self,
         days: int = 30
     ) -> dict:
-        """활동 요약 통계"""
-        start_date = datetime.utcnow() - timedelta(days=days)
+        """활동 요약 통계 (집계는 DB GROUP BY 로 수행)"""
+        start_date = _utcnow() - timedelta(days=days)
+        count = func.count(AuditLog.id)
 
-        logs = self.db.query(AuditLog).filter(
-            AuditLog.timestamp >= start_date
-        ).all()
+        def grouped(column, limit: Optional[int] = None) -> list[tuple]:
+            query = self.db.query(column, count).filter(
+                AuditLog.timestamp >= start_date
+            ).group_by(column)
+            if limit is not None:
+                query = query.order_by(count.desc()).limit(limit)
+            return query.all()
 
-        # 액션별 집계
-        action_counts = {}
-        user_counts = {}
-        resource_counts = {}
+        action_counts = dict(grouped(AuditLog.action))
         result_counts = {"SUCCESS": 0, "DENIED": 0, "ERROR": 0}
-
-        for log in logs:
-            action_counts[log.action] = action_counts.get(log.action, 0) + 1
-            user_counts[log.user_id] = user_counts.get(log.user_id, 0) + 1
-            resource_counts[log.resource] = resource_counts.get(log.resource, 0) + 1
-            if log.result in result_counts:
-                result_counts[log.result] += 1
+        for result, n in grouped(AuditLog.result):
+            if result in result_counts:
+                result_counts[result] = n
+        user_counts = [tuple(row) for row in grouped(AuditLog.user_id)]
 
         return {
             "period_days": days,
-            "total_events": len(logs),
+            "total_events": sum(action_counts.values()),
             "by_action": action_counts,
             "by_result": result_counts,
             "unique_users": len(user_counts),
             "most_active_users": sorted(
-                user_counts.items(),
+                user_counts,
                 key=lambda x: x[1],
                 reverse=True
             )[:10],
-            "most_accessed_resources": sorted(
-                resource_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
+            "most_accessed_resources": [
+                tuple(row) for row in grouped(AuditLog.resource, limit=10)
+            ]
         }
 
     def get_daily_trend(
@@ -420,18 +652,16 @@ class AuditLogger:
         days: int = 30
     ) -> list[dict]:
         """일별 활동 트렌드"""
-        end_date = datetime.utcnow()
+        end_date = _utcnow()
         start_date = end_date - timedelta(days=days)
 
-        # 일별 집계 (실제로는 DB 집계 함수 사용)
-        logs = self.db.query(AuditLog).filter(
+        day = func.date(AuditLog.timestamp)
+        rows = self.db.query(day, func.count(AuditLog.id)).filter(
             AuditLog.timestamp >= start_date
-        ).all()
+        ).group_by(day).all()
 
-        daily_counts = {}
-        for log in logs:
-            date_key = log.timestamp.strftime("%Y-%m-%d")
-            daily_counts[date_key] = daily_counts.get(date_key, 0) + 1
+        # date() 반환 타입은 드라이버마다 다름 (date 또는 'YYYY-MM-DD' 문자열)
+        daily_counts = {str(d)[:10]: n for d, n in rows}
 
         trend = []
         current = start_date
@@ -454,9 +684,15 @@ class AuditLogger:
         report_type: str = "full"
     ) -> dict:
         """컴플라이언스 보고서 생성"""
-        logs = self.db.query(AuditLog).filter(
-            AuditLog.timestamp.between(start_date, end_date)
-        ).all()
+        in_period = AuditLog.timestamp.between(start_date, end_date)
+
+        # 결과별 건수는 DB 에서 집계
+        result_counts = dict(
+            self.db.query(AuditLog.result, func.count(AuditLog.id))
+            .filter(in_period)
+            .group_by(AuditLog.result)
+            .all()
+        )
 
         report = {
             "report_type": report_type,
@@ -464,20 +700,29 @@ class AuditLogger:
                 "start": start_date.isoformat(),
                 "end": end_date.isoformat()
             },
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": _utcnow().isoformat(),
             "summary": {
-                "total_events": len(logs),
-                "successful_operations": len([l for l in logs if l.result == "SUCCESS"]),
-                "denied_accesses": len([l for l in logs if l.result == "DENIED"]),
-                "errors": len([l for l in logs if l.result == "ERROR"])
+                "total_events": sum(result_counts.values()),
+                "successful_operations": result_counts.get("SUCCESS", 0),
+                "denied_accesses": result_counts.get("DENIED", 0),
+                "errors": result_counts.get("ERROR", 0)
             },
             "security_incidents": [],
             "data_exports": [],
             "privileged_operations": []
         }
 
-        # 보안 인시던트
+        # 보고서 항목에 해당하는 행만 조회
+        logs = self.db.query(AuditLog).filter(
+            in_period,
+            or_(
+                AuditLog.action.in_(_REPORTED_ACTIONS),
+                AuditLog.user_role == "admin"
+            )
+        ).yield_per(_EXPORT_CHUNK_SIZE)
+
         for log in logs:
+            # 보안 인시던트
             if log.action == "SECURITY_EVENT":
                 report["security_incidents"].append({
                     "timestamp": log.timestamp.isoformat(),
@@ -494,7 +739,7 @@ class AuditLogger:
                 })
 
             # 권한 있는 작업 (DELETE, 관리자 작업)
-            if log.action in ["DELETE", "ADMIN_ACTION"] or log.user_role == "admin":
+            if log.action in _PRIVILEGED_ACTIONS or log.user_role == "admin":
                 report["privileged_operations"].append({
                     "timestamp": log.timestamp.isoformat(),
                     "user_id": log.user_id,
@@ -509,35 +754,62 @@ class AuditLogger:
         self,
         start_date: datetime,
         end_date: datetime,
-        format: str = "json"
-    ) -> str:
-        """감사 로그 내보내기"""
-        logs = self.get_logs(start_date=start_date, end_date=end_date, limit=10000)
-
-        if format == "json":
-            return json.dumps([
-                {
-                    "log_id": log.log_id,
-                    "timestamp": log.timestamp.isoformat(),
-                    "user_id": log.user_id,
-                    "user_role": log.user_role,
-                    "action": log.action,
-                    "resource": log.resource,
-                    "resource_id": log.resource_id,
-                    "result": log.result,
-                    "ip_address": log.ip_address,
-                    "details": log.details
-                }
-                for log in logs
-            ], indent=2)
-
-        elif format == "csv":
-            lines = ["log_id,timestamp,user_id,user_role,action,resource,resource_id,result,ip_address"]
-            for log in logs:
-                lines.append(
-                    f"{log.log_id},{log.timestamp.isoformat()},{log.user_id},{log.user_role},"
-                    f"{log.action},{log.resource},{log.resource_id or ''},{log.result},{log.ip_address or ''}"
-                )
-            return "\n".join(lines)
+        format: str = "json",
+        on_complete: Optional[Callable[[int, bool], None]] = None
+    ) -> Iterator[str]:
+        """
+        감사 로그 내보내기 (청크 단위 스트리밍)
 
-        return ""
+        행을 yield_per 로 나눠 읽고 한 행씩 직렬화해 내보내므로
+        전체 결과를 메모리에 올리지 않는다. 스트림이 끝나거나 중단되면
+        (클라이언트 연결 종료, 오류) on_complete(내보낸 행 수, 완료 여부) 를 호출한다.
+        """
+        if format not in ("json", "csv"):
+            return
+
+        rows = self.db.query(AuditLog).filter(
+            AuditLog.timestamp >= start_date,
+            AuditLog.timestamp <= end_date
+        ).order_by(desc(AuditLog.timestamp)).limit(_EXPORT_LIMIT).yield_per(_EXPORT_CHUNK_SIZE)
+
+        count = 0
+        completed = False
+        try:
+            if format == "json":
+                yield "["
+                for log in rows:
+                    chunk = ("," if count else "") + json.dumps({
+                        "log_id": log.log_id,
+                        "timestamp": log.timestamp.isoformat(),
+                        "user_id": log.user_id,
+                        "user_role": log.user_role,
+                        "action": log.action,
+                        "resource": log.resource,
+                        "resource_id": log.resource_id,
+                        "result": log.result,
+                        "ip_address": log.ip_address,
+                        "details": log.details
+                    })
+                    count += 1
+                    yield chunk
+                yield "]"
+
+            else:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, lineterminator="\n")
+                yield "log_id,timestamp,user_id,user_role,action,resource,resource_id,result,ip_address\n"
+                for log in rows:
+                    writer.writerow((
+                        log.log_id, log.timestamp.isoformat(), log.user_id, log.user_role,
+                        log.action, log.resource, log.resource_id or "", log.result, log.ip_address or ""
+                    ))
+                    chunk = buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+                    count += 1
+                    yield chunk
+
+            completed = True
+        finally:
+            if on_complete is not None:
+                on_complete(count, completed)
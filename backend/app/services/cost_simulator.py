@@ -1,9 +1,12 @@
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Optional
-from .yield_model import YieldModel
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping, Optional
+from .yield_model import YieldModel, YieldResult
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CostBreakdown:
     """비용 분석 결과"""
     wafer_cost: float
@@ -19,7 +22,7 @@ class CostBreakdown:
     yield_rate: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VolumeEconomics:
     """볼륨별 경제성 분석"""
     volume: int
@@ -30,22 +33,33 @@ class VolumeEconomics:
 
 
 # 공정 노드별 웨이퍼 비용 (USD)
-DEFAULT_WAFER_COSTS = {
+DEFAULT_WAFER_COSTS: Final[Mapping[int, float]] = MappingProxyType({
     3: 20000,
     5: 16000,
     7: 10000,
     10: 6000,
     14: 4000,
-}
+})
 
 # 공정 노드별 결함 밀도 (defects/cm²)
-DEFAULT_DEFECT_DENSITY = {
+DEFAULT_DEFECT_DENSITY: Final[Mapping[int, float]] = MappingProxyType({
     3: 0.12,  # 신규 공정, 높은 결함률
     5: 0.08,  # 성숙 공정
     7: 0.05,  # 매우 성숙한 공정
     10: 0.04,
     14: 0.03,
-}
+})
+
+# 테이블에 없는 노드의 기본값
+_FALLBACK_WAFER_COST: Final[float] = 8000
+_FALLBACK_DEFECT_DENSITY: Final[float] = 0.06
+
+# 인스턴스당 calculate_cost 결과 캐시 크기
+_COST_CACHE_SIZE: Final[int] = 2048
+
+# 볼륨 할인 구간: 생산량이 THRESHOLDS[i] 이상이면 FACTORS[i + 1] 적용
+_VOLUME_DISCOUNT_THRESHOLDS: Final[tuple[int, ...]] = (10000, 50000, 100000, 500000, 1000000)
+_VOLUME_DISCOUNT_FACTORS: Final[tuple[float, ...]] = (1.0, 0.97, 0.93, 0.88, 0.82, 0.75)  # 최대 25% 할인
 
 
 class CostSimulator:
@@ -62,13 +76,30 @@ class CostSimulator:
         self.wafer_costs = wafer_costs or DEFAULT_WAFER_COSTS
         self.defect_densities = defect_densities or DEFAULT_DEFECT_DENSITY
 
+        # 노드별 (웨이퍼 비용, 결함 밀도) - calculate_cost 에서 한 번의 조회로 사용
+        self._node_params: dict[int, tuple[float, float]] = {
+            node_nm: (self.get_wafer_cost(node_nm), self.get_defect_density(node_nm))
+            for node_nm in self.wafer_costs.keys() | self.defect_densities.keys()
+        }
+
+        # calculate_cost 는 입력에 대해 결정적이므로 인스턴스별로 결과 캐시
+        # (반환된 CostBreakdown 은 호출자 간에 공유됨)
+        self._cached_cost = lru_cache(maxsize=_COST_CACHE_SIZE)(self._calculate_cost)
+
     def get_wafer_cost(self, node_nm: int) -> float:
         """공정 노드별 웨이퍼 비용 조회"""
-        return self.wafer_costs.get(node_nm, 8000)
+        return self.wafer_costs.get(node_nm, _FALLBACK_WAFER_COST)
 
     def get_defect_density(self, node_nm: int) -> float:
         """공정 노드별 결함 밀도 조회"""
-        return self.defect_densities.get(node_nm, 0.06)
+        return self.defect_densities.get(node_nm, _FALLBACK_DEFECT_DENSITY)
+
+    def get_node_params(self, node_nm: int) -> tuple[float, float]:
+        """공정 노드별 (웨이퍼 비용, 결함 밀도) 조회"""
+        params = self._node_params.get(node_nm)
+        if params is None:
+            return _FALLBACK_WAFER_COST, _FALLBACK_DEFECT_DENSITY
+        return params
 
     def estimate_package_cost(self, die_size: float, node_nm: int) -> float:
         """
@@ -113,40 +144,20 @@ class CostSimulator:
 
         볼륨이 증가할수록 단가 감소
         """
-        if volume >= 1000000:
-            return 0.75  # 25% 할인
-        elif volume >= 500000:
-            return 0.82
-        elif volume >= 100000:
-            return 0.88
-        elif volume >= 50000:
-            return 0.93
-        elif volume >= 10000:
-            return 0.97
-        else:
-            return 1.0
+        return _VOLUME_DISCOUNT_FACTORS[bisect_right(_VOLUME_DISCOUNT_THRESHOLDS, volume)]
 
-    def calculate_cost(
+    def _calculate_die_costs(
         self,
         die_size: float,
-        node_nm: int,
-        volume: int = 100000,
-        target_asp: float = 100.0
-    ) -> CostBreakdown:
+        node_nm: int
+    ) -> tuple[float, float, float, float, float, YieldResult]:
         """
-        종합 비용 계산
-
-        Args:
-            die_size: 다이 면적 (mm²)
-            node_nm: 공정 노드 (nm)
-            volume: 연간 생산량
-            target_asp: 목표 판매가 (USD)
+        볼륨과 무관한 다이 단위 비용 계산
 
         Returns:
-            CostBreakdown with all cost metrics
+            (wafer_cost, die_cost, good_die_cost, package_cost, test_cost, yield_result)
         """
-        wafer_cost = self.get_wafer_cost(node_nm)
-        defect_density = self.get_defect_density(node_nm)
+        wafer_cost, defect_density = self.get_node_params(node_nm)
 
         # 수율 계산
         yield_result = YieldModel.calculate(die_size, defect_density)
@@ -167,6 +178,40 @@ class CostSimulator:
         package_cost = self.estimate_package_cost(die_size, node_nm)
         test_cost = self.estimate_test_cost(die_size)
 
+        return wafer_cost, die_cost, good_die_cost, package_cost, test_cost, yield_result
+
+    def calculate_cost(
+        self,
+        die_size: float,
+        node_nm: int,
+        volume: int = 100000,
+        target_asp: float = 100.0
+    ) -> CostBreakdown:
+        """
+        종합 비용 계산
+
+        Args:
+            die_size: 다이 면적 (mm²)
+            node_nm: 공정 노드 (nm)
+            volume: 연간 생산량
+            target_asp: 목표 판매가 (USD)
+
+        Returns:
+            CostBreakdown with all cost metrics
+        """
+        return self._cached_cost(die_size, node_nm, volume, target_asp)
+
+    def _calculate_cost(
+        self,
+        die_size: float,
+        node_nm: int,
+        volume: int,
+        target_asp: float
+    ) -> CostBreakdown:
+        wafer_cost, die_cost, good_die_cost, package_cost, test_cost, yield_result = (
+            self._calculate_die_costs(die_size, node_nm)
+        )
+
         # 총 단가
         base_unit_cost = good_die_cost + package_cost + test_cost
 
@@ -201,6 +246,9 @@ class CostSimulator:
     ) -> list[VolumeEconomics]:
         """
         볼륨별 경제성 분석
+
+        수율/다이/패키징/테스트 비용은 볼륨과 무관하므로 한 번만 계산하고
+        볼륨별로는 할인율과 고정비 분담만 적용한다.
         """
         if volumes is None:
             volumes = [10000, 50000, 100000, 500000, 1000000]
@@ -208,17 +256,17 @@ class CostSimulator:
         results = []
         fixed_costs = 50000000  # 마스크, NRE 등 고정비용 (예시)
 
+        _, _, good_die_cost, package_cost, test_cost, _ = self._calculate_die_costs(die_size, node_nm)
+        base_unit_cost = good_die_cost + package_cost + test_cost
+
         for volume in volumes:
-            cost_result = self.calculate_cost(
-                die_size, node_nm, volume, target_asp
-            )
+            volume_discount = self.calculate_volume_discount(volume)
 
-            # 고정비용 분담
+            # 고정비용 분담 (calculate_cost 와 동일하게 할인 단가는 반올림 후 합산)
             fixed_per_unit = fixed_costs / volume if volume > 0 else fixed_costs
-            total_unit_cost = cost_result.total_unit_cost + fixed_per_unit
+            total_unit_cost = round(base_unit_cost * volume_discount, 2) + fixed_per_unit
 
             total_cost = total_unit_cost * volume
-            volume_discount = self.calculate_volume_discount(volume)
 
             # 손익분기점 계산
             margin_per_unit = target_asp - total_unit_cost
@@ -11,10 +11,10 @@ from ..ontology import (
     SemiconductorOntology,
     AIIndustryOntology,
     MaterialsKnowledgeBase,
-    EquipmentKnowledgeBase,
     ProcessFlowOntology,
-    FailureModeOntology,
 )
+# 테이블은 최초 접근 시 생성되므로 이름이 아닌 모듈로 import (import 시점 생성 방지)
+from ..ontology import equipment as _equipment, failure_modes as _failure_modes
 
 
 class GraphMigrator:
@@ -351,7 +351,7 @@ class GraphMigrator:
 
     def migrate_equipment(self) -> int:
         """Equipment 노드 생성 (7개)"""
-        equips = EquipmentKnowledgeBase.get_all_equipment()
+        equips = _equipment.EQUIPMENT_DB
         count = 0
         for key, eq in equips.items():
             Neo4jClient.run_write(
@@ -419,7 +419,7 @@ class GraphMigrator:
                     "order": step.order,
                     "equip_type": step.equipment_type,
                     "duration": step.typical_duration_minutes,
-                    "yield_impact": step.yield_impact,
+                    "yield_impact": step.yield_impact.value,
                     "defect_types": step.defect_types,
                     "description": step.description,
                 },
@@ -442,7 +442,7 @@ class GraphMigrator:
 
     def migrate_defect_types(self) -> int:
         """DefectType 노드 생성 (6개)"""
-        defects = FailureModeOntology.get_all_defect_types()
+        defects = _failure_modes.DEFECT_TYPES
         count = 0
         for key, defect in defects.items():
             Neo4jClient.run_write(
@@ -484,7 +484,7 @@ class GraphMigrator:
 
     def migrate_failure_modes(self) -> int:
         """EquipmentFailure 노드 생성 (4개)"""
-        modes = FailureModeOntology.get_all_failure_modes()
+        modes = _failure_modes.EQUIPMENT_FAILURE_MODES
         count = 0
         for key, fm in modes.items():
             Neo4jClient.run_write(
@@ -754,7 +754,7 @@ class GraphMigrator:
         매핑: step.equipment_type 문자열에 포함된 카테고리와
               Equipment.category 매칭
         """
-        equips = EquipmentKnowledgeBase.get_all_equipment()
+        equips = _equipment.EQUIPMENT_DB
         count = 0
 
         # equipment_type 문자열 → category 매핑
@@ -864,7 +864,7 @@ class GraphMigrator:
         매핑: defect.affected_process_steps = ["CVD", "PVD", "ETCH"] →
               해당 equipment_type을 사용하는 ProcessStep과 연결
         """
-        defects = FailureModeOntology.get_all_defect_types()
+        defects = _failure_modes.DEFECT_TYPES
         steps = ProcessFlowOntology.get_full_flow()
         count = 0
 
@@ -914,8 +914,8 @@ class GraphMigrator:
 
         매핑: fm.equipment_type = "LITHOGRAPHY" → category=LITHOGRAPHY인 장비
         """
-        modes = FailureModeOntology.get_all_failure_modes()
-        equips = EquipmentKnowledgeBase.get_all_equipment()
+        modes = _failure_modes.EQUIPMENT_FAILURE_MODES
+        equips = _equipment.EQUIPMENT_DB
         count = 0
 
         for fm_key, fm in modes.items():
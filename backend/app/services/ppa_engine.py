@@ -2,9 +2,9 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChipConfig:
-    """칩 구성 입력 파라미터"""
+    """칩 구성 입력 파라미터 (불변, 결과 캐시 키로 사용)"""
     process_node_nm: int  # 3, 5, 7
     cpu_cores: int
     gpu_cores: int = 0
@@ -19,10 +19,11 @@ from app.ontology import (
     SemiconductorOntology,
     AIIndustryOntology,
     MaterialsKnowledgeBase,
-    EquipmentKnowledgeBase,
     ProcessFlowOntology,
     FailureModeOntology,
 )
+# 테이블은 최초 접근 시 생성되므로 이름이 아닌 모듈로 import (import 시점 생성 방지)
+from app.ontology import equipment as _equipment, failure_modes as _failure_modes
 
 
 # ============================================================
@@ -334,7 +335,7 @@ class SeedDataAgent:
     def generate_fab_equipment(self) -> list[dict]:
         """장비 온톨로지 기반 Fab 장비 목록"""
         equipment_list = []
-        equip_db = EquipmentKnowledgeBase.get_all_equipment()
+        equip_db = _equipment.EQUIPMENT_DB
         process_steps = ProcessFlowOntology.get_ordered_flow()
         node_nm = self.node_info.node_nm if self.node_info else 3
 
@@ -609,7 +610,7 @@ class SeedDataAgent:
     def generate_suppliers(self) -> list[dict]:
         """온톨로지 기반 공급업체"""
         suppliers = []
-        equip_db = EquipmentKnowledgeBase.get_all_equipment()
+        equip_db = _equipment.EQUIPMENT_DB
 
         # Tier-1: 장비 공급업체
         vendor_set = set()
@@ -708,7 +709,7 @@ class SeedDataAgent:
         """이력 웨이퍼 데이터 (온톨로지 기반 현실적 수율/센서 데이터)"""
         records = []
         process_steps = ProcessFlowOntology.get_ordered_flow()
-        failure_modes = FailureModeOntology.get_all_defect_types()
+        failure_modes = _failure_modes.DEFECT_TYPES
         node_nm = self.node_info.node_nm if self.node_info else 3
         base_yield = self.node_info.typical_yield_pct if self.node_info else 80.0
         products = self._get_product_mix()
@@ -782,7 +783,7 @@ class SeedDataAgent:
     def generate_yield_events(self) -> list[dict]:
         """온톨로지 기반 수율 이벤트"""
         events = []
-        failure_modes = FailureModeOntology.get_all_defect_types()
+        failure_modes = _failure_modes.DEFECT_TYPES
         process_steps = ProcessFlowOntology.get_ordered_flow()
 
         # 시나리오에 따른 이벤트 수
@@ -0,0 +1,62 @@
+"""access_control 정책 인덱스 테스트"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from app.services import access_control
+
+
+class _FakeQuery:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def filter(self, *criteria):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, policies):
+        self._policies = policies
+
+    def query(self, model):
+        return _FakeQuery(self._policies)
+
+
+def _policy(policy_id, roles, resources, conditions=None):
+    return SimpleNamespace(
+        policy_id=policy_id,
+        name=policy_id,
+        roles=roles,
+        resources=resources,
+        actions=["VIEW"],
+        conditions=conditions,
+        valid_from=None,
+        valid_until=None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    access_control.clear_access_cache()
+    yield
+    access_control.clear_access_cache()
+
+
+@pytest.mark.parametrize("broken", [
+    _policy("POL-BAD-REGEX", ["engineer", "viewer"], ["yield:(*"]),
+    _policy("POL-BAD-TIME", ["engineer", "viewer"], ["yield:*"],
+            [{"type": "TIME", "operator": "BETWEEN", "value": 9}]),
+])
+def test_malformed_policy_is_skipped(broken):
+    valid = _policy("POL-OK", ["engineer"], ["yield:*"])
+    index = access_control._get_role_policy_index(_FakeSession([broken, valid]))
+
+    assert [p.policy_id for p in index["engineer"]] == ["POL-OK"]
+    assert "viewer" not in index
+    assert index["engineer"][0].matches_resource("yield:events")
@@ -0,0 +1,57 @@
+"""ai_insight_service 프롬프트/SSE 직렬화 테스트"""
+
+import json
+import math
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from enum import Enum
+
+import pytest
+
+pytest.importorskip("anthropic")
+pytest.importorskip("pydantic_settings")
+
+from app.services import ai_insight_service as svc
+
+
+class Grade(str, Enum):
+    HIGH = "high"
+
+
+def _tricky_results() -> list:
+    counts = defaultdict(int)
+    counts["etch"] += 2
+    return [
+        OrderedDict(node="3nm", grade=Grade.HIGH),
+        {"counts": counts, "big": 2**70, "nan": math.nan, "inf": math.inf},
+        {"at": datetime(2024, 1, 2, 3, 4, 5), 7: "int key", "한글": "값"},
+    ]
+
+
+def _stdlib_prompt(query_type: str, results: object) -> str:
+    prefix, suffix = svc._PROMPT_PARTS[query_type]
+    body = json.dumps(results, ensure_ascii=False, indent=2, default=str)
+    if len(body) > svc._RESULTS_LIMIT:
+        body = body[:svc._RESULTS_LIMIT] + "\n... (결과 일부 생략)"
+    return prefix + body + suffix
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_prompt_matches_stdlib_json(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(svc, "orjson", None)
+    results = _tricky_results()
+    assert svc._build_prompt("custom", results) == _stdlib_prompt("custom", results)
+
+
+def test_prompt_truncation_matches_full_serialization():
+    results = [{"id": i, "name": f"material-{i}"} for i in range(2000)]
+    assert svc._build_prompt("custom", results) == _stdlib_prompt("custom", results)
+
+
+def test_sse_chunk_same_with_and_without_orjson(monkeypatch):
+    text = '핵심 "발견"\n- HBM3E'
+    encoded = svc._sse_chunk(text)
+    monkeypatch.setattr(svc, "orjson", None)
+    assert svc._sse_chunk(text) == encoded
+    assert json.loads(encoded[len(b"data: "):]) == {"chunk": text}
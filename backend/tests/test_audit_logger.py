@@ -0,0 +1,145 @@
+"""audit_logger 테스트"""
+
+import multiprocessing
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from app.services import audit_logger
+
+_NOW = datetime(2024, 1, 2, 3, 4, 5)
+
+
+def _make_ids(count: int) -> list[str]:
+    return [audit_logger._make_log_id(_NOW) for _ in range(count)]
+
+
+@pytest.mark.parametrize("start_method", ["spawn", "fork"])
+def test_log_ids_do_not_collide_across_processes(start_method):
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method} not supported")
+
+    parent_ids = _make_ids(100)
+    with multiprocessing.get_context(start_method).Pool(2) as pool:
+        child_ids = pool.map(_make_ids, [100, 100])
+
+    all_ids = parent_ids + child_ids[0] + child_ids[1]
+    assert len(set(all_ids)) == len(all_ids)
+    assert all(len(log_id) <= 50 for log_id in all_ids)
+
+
+def _recording_queue(monkeypatch, write):
+    q = audit_logger._AuditQueue()
+    monkeypatch.setattr(q, "_write", write)
+    return q
+
+
+def test_flusher_survives_write_errors(monkeypatch):
+    written = []
+
+    def write(batch):
+        if batch[0]["n"] == 0:
+            raise RuntimeError("engine unavailable")
+        written.extend(entry["n"] for entry in batch)
+
+    q = _recording_queue(monkeypatch, write)
+    q.put({"n": 0})
+    assert q.flush(timeout=5)
+    q.put({"n": 1})
+    assert q.flush(timeout=5)
+    assert written == [1]
+    assert q._thread.is_alive()
+
+
+def test_dead_flusher_thread_is_restarted(monkeypatch):
+    written = []
+    q = _recording_queue(monkeypatch, lambda batch: written.extend(batch))
+
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    q._thread = dead
+
+    q.put({"n": 1})
+    assert q.flush(timeout=5)
+    assert written == [{"n": 1}]
+    assert q._thread is not dead and q._thread.is_alive()
+
+
+def test_flush_times_out_when_writes_hang(monkeypatch):
+    release = threading.Event()
+    q = _recording_queue(monkeypatch, lambda batch: release.wait(10))
+
+    q.put({"n": 1})
+    time.sleep(audit_logger._FLUSH_INTERVAL_SEC + 0.2)  # 백그라운드 스레드가 배치를 가져가도록
+    started = time.monotonic()
+    assert q.flush(timeout=0.2) is False
+    assert time.monotonic() - started < 2
+    release.set()
+    assert q.flush(timeout=5)
+
+
+class _FakeLog:
+    def __init__(self, n: int):
+        self.log_id = f"LOG-{n}"
+        self.timestamp = _NOW
+        self.user_id = n
+        self.user_role = "admin"
+        self.action = "READ"
+        self.resource = "wafers"
+        self.resource_id = None
+        self.result = "SUCCESS"
+        self.ip_address = None
+        self.details = {}
+
+
+class _FakeQuery:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def yield_per(self, n):
+        return iter(self._rows)
+
+
+class _FakeSession:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def query(self, model):
+        return _FakeQuery(self._rows)
+
+
+@pytest.mark.parametrize("fmt", ["json", "csv"])
+def test_export_records_completed_stream(fmt):
+    calls = []
+    audit = audit_logger.AuditLogger(_FakeSession([_FakeLog(i) for i in range(3)]))
+
+    list(audit.export_logs(_NOW, _NOW, format=fmt, on_complete=lambda *a: calls.append(a)))
+
+    assert calls == [(3, True)]
+
+
+@pytest.mark.parametrize("fmt", ["json", "csv"])
+def test_export_records_aborted_stream(fmt):
+    calls = []
+    audit = audit_logger.AuditLogger(_FakeSession([_FakeLog(i) for i in range(5)]))
+
+    stream = audit.export_logs(_NOW, _NOW, format=fmt, on_complete=lambda *a: calls.append(a))
+    next(stream)  # 헤더 / "["
+    next(stream)  # 첫 행
+    stream.close()  # 클라이언트 연결 종료
+
+    assert calls == [(1, False)]
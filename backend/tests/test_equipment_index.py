@@ -0,0 +1,22 @@
+"""equipment 카테고리 색인 테스트"""
+
+from app.ontology.equipment import EquipmentKnowledgeBase, _equipment_db
+
+
+def test_get_by_category_keeps_insertion_order():
+    categories = {e.category for e in _equipment_db().values()}
+    for cat in categories:
+        expected = [e for e in _equipment_db().values() if e.category == cat]
+        assert list(EquipmentKnowledgeBase.get_by_category(cat)) == expected
+
+
+def test_get_by_category_node_filters_by_min_node():
+    categories = {e.category for e in _equipment_db().values()}
+    for cat in categories:
+        for node_nm in (2, 3, 5, 7, 14, 28):
+            expected = {
+                id(e) for e in _equipment_db().values()
+                if e.category == cat and e.min_node_nm <= node_nm
+            }
+            found = EquipmentKnowledgeBase.get_by_category_node(cat, node_nm)
+            assert {id(e) for e in found} == expected
@@ -0,0 +1,41 @@
+"""온톨로지 테이블 지연 생성 테스트 (앱 import 만으로 테이블이 생성되지 않아야 함)"""
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+
+_CHECK = """
+import app.api
+from app.ontology import equipment, failure_modes, materials, process_flow
+builders = {
+    "equipment._equipment_db": equipment._equipment_db,
+    "failure_modes._defect_types": failure_modes._defect_types,
+    "failure_modes._equipment_failure_modes": failure_modes._equipment_failure_modes,
+    "materials._materials": materials._materials,
+    "process_flow._process_flow": process_flow._process_flow,
+}
+built = [name for name, fn in builders.items() if fn.cache_info().currsize]
+print(",".join(built))
+"""
+
+
+def test_importing_api_does_not_build_tables():
+    # 새 인터프리터에서 확인 (다른 테스트가 이미 테이블을 만들었을 수 있으므로)
+    out = subprocess.run(
+        [sys.executable, "-c", _CHECK],
+        capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == ""
+
+
+def test_package_table_access_is_cached():
+    import app.ontology as ontology
+    from app.ontology import materials
+
+    table = ontology.MATERIALS
+    assert table is materials.MATERIALS
+    assert vars(ontology)["MATERIALS"] is table
@@ -0,0 +1,49 @@
+"""simulation API 캐시 테스트"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+
+from app.api import simulation
+from app.services.ppa_engine import ChipConfig
+
+_CONFIG = dict(
+    process_node_nm=5,
+    cpu_cores=8,
+    gpu_cores=16,
+    npu_cores=4,
+    l2_cache_mb=8,
+    l3_cache_mb=32,
+    pcie_lanes=16,
+    memory_channels=4,
+    target_frequency_ghz=3.0,
+)
+
+
+def test_cached_ppa_returns_independent_results():
+    first = simulation._calculate_ppa(ChipConfig(**_CONFIG))
+    second = simulation._calculate_ppa(ChipConfig(**_CONFIG))
+
+    assert first == second
+    assert first is not second
+    assert first.area_breakdown is not second.area_breakdown
+
+    first.die_size_mm2 = -1.0
+    first.area_breakdown.cpu = -1.0
+    third = simulation._calculate_ppa(ChipConfig(**_CONFIG))
+    assert third == second
+
+
+def test_cached_ppa_alternatives_return_independent_results():
+    first = simulation._calculate_ppa_alternatives(ChipConfig(**_CONFIG))
+    second = simulation._calculate_ppa_alternatives(ChipConfig(**_CONFIG))
+
+    assert first == second
+    assert first is not second
+    assert first.alternatives is not second.alternatives
+    assert first.alternatives[0].result is not second.alternatives[0].result
+
+    first.alternatives.clear()
+    third = simulation._calculate_ppa_alternatives(ChipConfig(**_CONFIG))
+    assert third == second